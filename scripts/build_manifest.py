@@ -2,7 +2,7 @@
 """Build segment manifest JSONs for missions with multi-file SPK kernels.
 
 Developer-only script — not part of the installed package.
-Requires: spiceypy, requests, beautifulsoup4
+Requires: spiceypy, requests (orjson optional, for faster writes)
 
 Usage:
     python scripts/build_manifest.py cassini
@@ -13,15 +13,28 @@ Usage:
 
 import argparse
 import json
+import os
+import queue
 import re
+import shutil
+import sqlite3
+import struct
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import requests
 import spiceypy as spice
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Where to write output manifests
 MANIFEST_DIR = Path(__file__).resolve().parent.parent / "src" / "heliospice" / "manifests"
@@ -30,6 +43,42 @@ MANIFEST_DIR = Path(__file__).resolve().parent.parent / "src" / "heliospice" / "
 NAIF_BASE = "https://naif.jpl.nasa.gov/pub/naif"
 LSK_URL = f"{NAIF_BASE}/generic_kernels/lsk/naif0012.tls"
 
+# Parallel download workers. SPICE calls stay on the main thread
+# (spiceypy is not thread-safe); only the HTTP transfers run in the pool.
+DEFAULT_WORKERS = 8
+
+# Coverage cache for incremental rebuilds, keyed by URL + HTTP validators
+COVERAGE_CACHE_PATH = Path(__file__).resolve().parent / ".coverage_cache.sqlite"
+
+# Copy buffer for streaming downloads to disk
+DOWNLOAD_CHUNK_BYTES = 16 * 1024 * 1024
+
+# Max downloaded-but-unprocessed files held on disk at once
+PENDING_FILES = 4
+
+# How often a worker blocked on the full result queue checks for shutdown
+QUEUE_POLL_S = 0.5
+
+# One keep-alive session for every request in the run, so the listing,
+# LSK, range reads, and downloads reuse pooled TLS connections to NAIF.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# DAF (Double precision Array File) layout — see NAIF's DAF Required Reading.
+# Records are 1024 bytes and numbered from 1. The file record holds the
+# summary format (ND, NI) and the first summary record number (FWARD).
+DAF_RECORD_BYTES = 1024
+DAF_BYTE_ORDERS = {"BIG-IEEE": ">", "LTL-IEEE": "<"}
+
+# href targets in an Apache/NAIF directory index
+HREF_RE = re.compile(r"""href\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+
 # Mission configurations: (base_url, filename_regex)
 MISSION_CONFIGS = {
     "cassini": {
@@ -65,16 +114,18 @@ MISSION_CONFIGS = {
 }
 
 
+class RangeNotSupported(Exception):
+    """Raised when a server ignores HTTP Range requests or the DAF is unreadable remotely."""
+
+
 def fetch_file_listing(base_url: str, pattern: re.Pattern) -> list[str]:
     """Fetch NAIF directory listing and filter filenames by regex."""
     print(f"  Fetching directory listing: {base_url}")
-    resp = requests.get(base_url, timeout=60)
+    resp = SESSION.get(base_url, timeout=60)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
 
     files = []
-    for link in soup.find_all("a"):
-        href = link.get("href", "")
+    for href in HREF_RE.findall(resp.text):
         name = href.rstrip("/").split("/")[-1]
         if pattern.match(name):
             files.append(name)
@@ -83,39 +134,187 @@ def fetch_file_listing(base_url: str, pattern: re.Pattern) -> list[str]:
     return sorted(files)
 
 
+def download_file(session: requests.Session, url: str, dest: Path) -> Path:
+    """Stream a remote file to dest. Removes partial files on failure."""
+    try:
+        resp = session.get(url, stream=True, timeout=300)
+        resp.raise_for_status()
+        # Copy from the raw urllib3 stream in C-sized blocks; decode_content
+        # keeps gzip/deflate transfer encodings transparent
+        resp.raw.decode_content = True
+        with open(dest, "wb") as f:
+            shutil.copyfileobj(resp.raw, f, length=DOWNLOAD_CHUNK_BYTES)
+    except Exception:
+        dest.unlink(missing_ok=True)
+        raise
+    return dest
+
+
+def _fetch_daf_record(session: requests.Session, url: str, record: int) -> bytes:
+    """Fetch one 1024-byte DAF record (1-based) via an HTTP Range request."""
+    offset = (record - 1) * DAF_RECORD_BYTES
+    headers = {"Range": f"bytes={offset}-{offset + DAF_RECORD_BYTES - 1}"}
+    resp = session.get(url, headers=headers, stream=True, timeout=60)
+    try:
+        resp.raise_for_status()
+        if resp.status_code != 206:
+            raise RangeNotSupported(f"server returned {resp.status_code} for a range request")
+        data = resp.content
+    finally:
+        resp.close()
+    if len(data) != DAF_RECORD_BYTES:
+        raise RangeNotSupported(f"short DAF record ({len(data)} bytes)")
+    return data
+
+
+def get_spk_coverage_remote(
+    session: requests.Session, url: str, naif_id: int
+) -> tuple[float, float] | None:
+    """Read SPK coverage for naif_id from the DAF summary records only.
+
+    Walks the summary record linked list with HTTP Range requests instead
+    of downloading the whole kernel.
+
+    Returns (start_et, stop_et), or None if no segment matches naif_id.
+
+    Raises:
+        RangeNotSupported: If ranges are refused or the file format is
+            not a binary DAF we can parse; callers should fall back to a
+            full download.
+    """
+    file_record = _fetch_daf_record(session, url, 1)
+    locidw = file_record[0:8].decode("ascii", errors="replace")
+    locfmt = file_record[88:96].decode("ascii", errors="replace")
+    if not locidw.startswith("DAF/") or locfmt not in DAF_BYTE_ORDERS:
+        raise RangeNotSupported(f"unsupported DAF header ({locidw!r}, {locfmt!r})")
+    order = DAF_BYTE_ORDERS[locfmt]
+
+    nd, ni = struct.unpack_from(f"{order}2i", file_record, 8)
+    fward = struct.unpack_from(f"{order}i", file_record, 76)[0]
+    summary_doubles = nd + (ni + 1) // 2
+
+    start_et = stop_et = None
+    record = fward
+    while record > 0:
+        data = _fetch_daf_record(session, url, record)
+        next_rec, _, nsum = struct.unpack_from(f"{order}3d", data, 0)
+        for i in range(int(nsum)):
+            offset = 24 + i * summary_doubles * 8
+            dc = struct.unpack_from(f"{order}{nd}d", data, offset)
+            ic = struct.unpack_from(f"{order}{ni}i", data, offset + nd * 8)
+            # SPK summaries: dc = (begin ET, end ET), ic[0] = target body
+            if ic[0] != naif_id:
+                continue
+            start_et = dc[0] if start_et is None else min(start_et, dc[0])
+            stop_et = dc[1] if stop_et is None else max(stop_et, dc[1])
+        record = int(next_rec)
+
+    if start_et is None:
+        return None
+    return start_et, stop_et
+
+
 def get_spk_coverage(bsp_path: str, naif_id: int) -> tuple[str, str] | None:
     """Extract time coverage from an SPK file using spiceypy.
 
-    Returns (start_date, stop_date) as ISO strings, or None if no coverage.
+    spkobj/spkcov open the DAF directly, so the file is never furnsh'ed
+    into the kernel pool. Only the LSK needs to be loaded (for et2utc).
+
+    Returns (start_date, stop_date) as ISO strings, or None if the file was
+    read successfully and has no coverage for naif_id.
+
+    Raises:
+        Exception: Whatever SPICE raises if the file cannot be read. Callers
+            must not record that as "no coverage".
+    """
+    # Skip files that carry no segments for this body
+    if naif_id not in spice.spkobj(bsp_path):
+        return None
+
+    cover = spice.spkcov(bsp_path, naif_id)
+    if spice.wncard(cover) == 0:
+        return None
+
+    # Get the overall window (first start to last stop)
+    start_et = spice.wnfetd(cover, 0)[0]
+    last_idx = spice.wncard(cover) - 1
+    stop_et = spice.wnfetd(cover, last_idx)[1]
+
+    start_utc = spice.et2utc(start_et, "ISOC", 0)[:10]
+    stop_utc = spice.et2utc(stop_et, "ISOC", 0)[:10]
+    return start_utc, stop_utc
+
+
+def open_coverage_cache(path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the SPK coverage cache database."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS coverage (
+            url TEXT NOT NULL,
+            naif_id INTEGER NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            size INTEGER,
+            start TEXT,
+            stop TEXT,
+            PRIMARY KEY (url, naif_id)
+        )"""
+    )
+    return conn
+
+
+def remote_validator(session: requests.Session, url: str) -> tuple | None:
+    """HEAD a URL and return (etag, last_modified, size), or None if unusable.
+
+    A failed HEAD (e.g. 405 or a 5xx) also returns None, so the caller reads
+    the file without consulting or updating the cache.
     """
     try:
-        spice.furnsh(bsp_path)
-        cover = spice.spkcov(bsp_path, naif_id)
-        if spice.wncard(cover) == 0:
-            spice.unload(bsp_path)
-            return None
-
-        # Get the overall window (first start to last stop)
-        start_et = spice.wnfetd(cover, 0)[0]
-        last_idx = spice.wncard(cover) - 1
-        stop_et = spice.wnfetd(cover, last_idx)[1]
-
-        start_utc = spice.et2utc(start_et, "ISOC", 0)[:10]
-        stop_utc = spice.et2utc(stop_et, "ISOC", 0)[:10]
-
-        spice.unload(bsp_path)
-        return start_utc, stop_utc
-    except Exception as e:
-        print(f"    Warning: could not read coverage from {bsp_path}: {e}")
-        try:
-            spice.unload(bsp_path)
-        except Exception:
-            pass
+        resp = session.head(url, allow_redirects=True, timeout=60)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        print(f"    Warning: HEAD {url} failed ({e}); not using the coverage cache")
+        return None
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    size = resp.headers.get("Content-Length")
+    if size is None or (etag is None and last_modified is None):
         return None
+    return etag, last_modified, int(size)
 
 
-def build_manifest(mission: str) -> None:
-    """Build a manifest JSON for a given mission."""
+def write_manifest(manifest: list[dict], output_path: Path) -> None:
+    """Write a manifest as indented JSON, atomically replacing any old file."""
+    if orjson is not None:
+        payload = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(manifest, indent=2).encode("utf-8")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, output_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def build_manifest(
+    mission: str,
+    workers: int = DEFAULT_WORKERS,
+    use_range: bool = True,
+    cache: sqlite3.Connection | None = None,
+) -> None:
+    """Build a manifest JSON for a given mission.
+
+    Remote reads run in a thread pool. With a coverage cache, each file is
+    first checked with a HEAD request and skipped if its ETag/Last-Modified
+    and size match the cached entry. With use_range, workers fetch only
+    the DAF summary records via HTTP Range requests; files whose server
+    refuses ranges are downloaded in full instead. Results are handed over
+    a bounded queue to the main thread, which does all SPICE and sqlite calls.
+    """
     config = MISSION_CONFIGS[mission]
     base_url = config["base_url"]
     pattern = config["pattern"]
@@ -129,7 +328,7 @@ def build_manifest(mission: str) -> None:
         lsk_path = Path(tmpdir) / "naif0012.tls"
         if not lsk_path.exists():
             print("  Downloading LSK...")
-            resp = requests.get(LSK_URL, timeout=60)
+            resp = SESSION.get(LSK_URL, timeout=60)
             resp.raise_for_status()
             lsk_path.write_bytes(resp.content)
         spice.furnsh(str(lsk_path))
@@ -137,42 +336,127 @@ def build_manifest(mission: str) -> None:
         # Get file listing
         files = fetch_file_listing(base_url, pattern)
 
-        manifest = []
-        for i, filename in enumerate(files):
-            print(f"  [{i+1}/{len(files)}] Processing {filename}...", end="", flush=True)
-
-            # Download to temp
-            file_path = Path(tmpdir) / filename
-            if not file_path.exists():
-                url = base_url + filename
+        # Previously computed coverage, keyed by URL: (validator, start, stop)
+        cached: dict[str, tuple] = {}
+        if cache is not None:
+            rows = cache.execute(
+                "SELECT url, etag, last_modified, size, start, stop FROM coverage WHERE naif_id = ?",
+                (naif_id,),
+            )
+            for url, etag, last_modified, size, start, stop in rows:
+                cached[url] = ((etag, last_modified, size), start, stop)
+
+        # (filename, kind, payload, validator) from workers, where kind is
+        # "cached" (payload = (start, stop) dates or None), "range"
+        # (payload = (start_et, stop_et) or None), "file" (payload = local
+        # Path), or "error" (payload = exception)
+        done: queue.Queue = queue.Queue(maxsize=PENDING_FILES)
+        # Set when the consumer loop exits early, so workers blocked on the
+        # full queue give up instead of hanging executor shutdown
+        stop_event = threading.Event()
+
+        def _deliver(item: tuple) -> None:
+            while not stop_event.is_set():
                 try:
-                    resp = requests.get(url, stream=True, timeout=300)
-                    resp.raise_for_status()
-                    with open(file_path, "wb") as f:
-                        for chunk in resp.iter_content(chunk_size=1024 * 1024):
-                            f.write(chunk)
-                except Exception as e:
-                    print(f" FAILED ({e})")
+                    done.put(item, timeout=QUEUE_POLL_S)
+                    return
+                except queue.Full:
                     continue
+            if item[1] == "file":
+                item[2].unlink(missing_ok=True)
+
+        def _fetch(filename: str) -> None:
+            if stop_event.is_set():
+                return
+            url = base_url + filename
+            validator = None
+            try:
+                if cache is not None:
+                    validator = remote_validator(SESSION, url)
+                    hit = cached.get(url)
+                    if validator is not None and hit is not None and hit[0] == validator:
+                        coverage = (hit[1], hit[2]) if hit[1] is not None else None
+                        _deliver((filename, "cached", coverage, validator))
+                        return
+                if use_range:
+                    try:
+                        ets = get_spk_coverage_remote(SESSION, url, naif_id)
+                        _deliver((filename, "range", ets, validator))
+                        return
+                    except RangeNotSupported:
+                        pass
+                path = download_file(SESSION, url, Path(tmpdir) / filename)
+                _deliver((filename, "file", path, validator))
+            except Exception as e:
+                _deliver((filename, "error", e, validator))
 
-            coverage = get_spk_coverage(str(file_path), naif_id)
-            if coverage is None:
-                print(" no coverage")
-                # Clean up to save space
-                file_path.unlink(missing_ok=True)
-                continue
-
-            start, stop = coverage
-            manifest.append({
-                "file": filename,
-                "url": base_url + filename,
-                "start": start,
-                "stop": stop,
-            })
-            print(f" {start} to {stop}")
-
-            # Clean up downloaded file to save disk space
-            file_path.unlink(missing_ok=True)
+        manifest = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for filename in files:
+                pool.submit(_fetch, filename)
+
+            try:
+                for i in range(len(files)):
+                    filename, kind, payload, validator = done.get()
+                    url = base_url + filename
+                    print(f"  [{i+1}/{len(files)}] Processing {filename}...", end="", flush=True)
+
+                    if kind == "error":
+                        print(f" FAILED ({payload})")
+                        continue
+
+                    if kind == "file":
+                        try:
+                            coverage = get_spk_coverage(str(payload), naif_id)
+                        except Exception as e:
+                            # A failed read is not "no coverage"; leave it uncached
+                            print(f" FAILED (could not read coverage: {e})")
+                            continue
+                        finally:
+                            # Clean up downloaded file to save disk space
+                            payload.unlink(missing_ok=True)
+                    elif kind == "range" and payload is not None:
+                        coverage = (
+                            spice.et2utc(payload[0], "ISOC", 0)[:10],
+                            spice.et2utc(payload[1], "ISOC", 0)[:10],
+                        )
+                    else:
+                        coverage = payload
+
+                    # Record fresh results (including "no coverage") for next run;
+                    # commit per file so an interrupted build keeps its progress
+                    if cache is not None and kind != "cached" and validator is not None:
+                        start, stop = coverage if coverage is not None else (None, None)
+                        cache.execute(
+                            "INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (url, naif_id, *validator, start, stop),
+                        )
+                        cache.commit()
+
+                    if coverage is None:
+                        print(" no coverage")
+                        continue
+
+                    start, stop = coverage
+                    manifest.append({
+                        "file": filename,
+                        "url": url,
+                        "start": start,
+                        "stop": stop,
+                    })
+                    print(f" {start} to {stop}" + (" (cached)" if kind == "cached" else ""))
+            finally:
+                # On an early exit (Ctrl-C, sqlite or SPICE errors) release
+                # the workers and remove any downloads nobody will read
+                stop_event.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+                while True:
+                    try:
+                        _, kind, payload, _ = done.get_nowait()
+                    except queue.Empty:
+                        break
+                    if kind == "file":
+                        payload.unlink(missing_ok=True)
 
         spice.kclear()
 
@@ -181,9 +465,7 @@ def build_manifest(mission: str) -> None:
 
     # Write JSON
     output_path = MANIFEST_DIR / f"{mission}.json"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    write_manifest(manifest, output_path)
 
     size_kb = output_path.stat().st_size / 1024
     print(f"\n  Wrote {output_path} ({len(manifest)} segments, {size_kb:.1f} KB)")
@@ -196,11 +478,37 @@ def main():
         choices=list(MISSION_CONFIGS.keys()) + ["all"],
         help="Mission to build manifest for (or 'all')",
     )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Parallel download workers (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--no-range",
+        action="store_true",
+        help="Download full SPK files instead of reading summaries via HTTP Range requests",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore and do not update the coverage cache ({COVERAGE_CACHE_PATH.name})",
+    )
     args = parser.parse_args()
 
+    cache = None if args.no_cache else open_coverage_cache(COVERAGE_CACHE_PATH)
     missions = list(MISSION_CONFIGS.keys()) if args.mission == "all" else [args.mission]
-    for mission in missions:
-        build_manifest(mission)
+    try:
+        for mission in missions:
+            build_manifest(
+                mission,
+                workers=args.workers,
+                use_range=not args.no_range,
+                cache=cache,
+            )
+    finally:
+        if cache is not None:
+            cache.close()
 
     print("\nDone!")
 
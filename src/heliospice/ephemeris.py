@@ -5,26 +5,47 @@ All functions resolve mission names, ensure kernels are loaded,
 and call SpiceyPy under the KernelManager lock for thread safety.
 """
 
+import functools
 import logging
+import math
+import re
 from datetime import date, datetime
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 import spiceypy as spice
 
-from .missions import resolve_mission, MISSION_NAIF_IDS
+from .missions import resolve_mission, MISSION_NAIF_IDS, MISSION_KERNELS, SEGMENTED_MISSIONS
 from .kernel_manager import get_kernel_manager
 
+if TYPE_CHECKING:
+    # pandas is only needed by get_trajectory; importing it lazily keeps
+    # ``import heliospice`` fast for single-point lookups
+    import pandas as pd
+
 logger = logging.getLogger("heliospice")
 
 # Astronomical unit in km (IAU 2012)
 AU_KM = 149597870.7
 
+# Step strings: a number with an optional d/h/m/s unit (default seconds)
+_STEP_RE = re.compile(r"^\s*(\d*\.?\d+(?:e[+-]?\d+)?)\s*([dhms]?)\s*$", re.IGNORECASE)
+_STEP_UNIT_SECONDS = {"d": 86400.0, "h": 3600.0, "m": 60.0, "s": 1.0, "": 1.0}
+
+# get_trajectory widens the step so a trajectory has at most this many
+# intervals (this + 1 points), to prevent memory issues
+_MAX_TRAJECTORY_STEPS = 100_000
+
+# J2000 epoch as a UTC timestamp (ET seconds are counted from here)
+_J2000_UTC = np.datetime64("2000-01-01T12:00:00", "ns")
+
 
+@functools.lru_cache(maxsize=256)
 def _resolve_body(name: str) -> tuple[int, str]:
     """Resolve a body name to (NAIF ID, canonical key).
 
     Tries mission registry first, then falls back to SPICE bodn2c.
+    Successful lookups are memoized; failures raise and are not cached.
     """
     try:
         return resolve_mission(name)
@@ -47,12 +68,22 @@ def _resolve_body(name: str) -> tuple[int, str]:
             raise KeyError(f"Cannot resolve body name '{name}'")
 
 
+def _is_et(time_input) -> bool:
+    """True if time_input is a numeric ephemeris time (seconds past J2000)."""
+    return isinstance(time_input, (int, float, np.number)) and not isinstance(time_input, bool)
+
+
 def _to_date(time_input) -> date:
-    """Extract a date from a string, datetime, or date object."""
+    """Extract a UTC date from a string, datetime, date, or numeric ET."""
     if isinstance(time_input, datetime):
         return time_input.date()
     if isinstance(time_input, date):
         return time_input
+    if _is_et(time_input):
+        km = get_kernel_manager()
+        km.ensure_lsk()
+        with km.lock:
+            return date.fromisoformat(spice.et2utc(float(time_input), "ISOC", 0)[:10])
     # Parse first 10 chars as ISO date (YYYY-MM-DD)
     return date.fromisoformat(str(time_input).strip()[:10])
 
@@ -63,12 +94,16 @@ def _ensure_kernels(
     time_start: date | None = None,
     time_end: date | None = None,
 ) -> None:
-    """Ensure relevant kernels are loaded for both target and observer."""
+    """Ensure relevant kernels are loaded for both target and observer.
+
+    Already-loaded kernels are skipped by the KernelManager's own
+    idempotency flags, which unload_all()/cache deletion keep in sync.
+    """
     km = get_kernel_manager()
     km.ensure_generic_kernels()
 
-    from .missions import MISSION_KERNELS, SEGMENTED_MISSIONS
-    for key in (target_key, observer_key):
+    # dict.fromkeys dedupes target == observer while keeping order
+    for key in dict.fromkeys((target_key, observer_key)):
         if key in MISSION_KERNELS:
             km.ensure_mission_kernels(key)
         elif key in SEGMENTED_MISSIONS:
@@ -83,12 +118,18 @@ def _ensure_kernels(
 def _to_et(time_input) -> float:
     """Convert a datetime or ISO string to SPICE ephemeris time (ET).
 
+    Numeric input is taken to be ET already and returned without a
+    utc2et call.
+
     Args:
-        time_input: datetime object, ISO 8601 string, or "YYYY-MM-DDTHH:MM:SS".
+        time_input: datetime object, ISO 8601 string, "YYYY-MM-DDTHH:MM:SS",
+            or ET seconds past J2000.
 
     Returns:
         SPICE ephemeris time (seconds past J2000).
     """
+    if _is_et(time_input):
+        return float(time_input)
     if isinstance(time_input, datetime):
         time_str = time_input.strftime("%Y-%m-%dT%H:%M:%S")
     elif isinstance(time_input, str):
@@ -99,25 +140,65 @@ def _to_et(time_input) -> float:
     return spice.utc2et(time_str)
 
 
+def _deltet(et_times: np.ndarray) -> np.ndarray:
+    """Vectorized ET - UTC (seconds) for an array of ephemeris times.
+
+    Numpy equivalent of ``spice.deltet(et, "ET")`` using the DELTET/*
+    constants from the loaded leapseconds kernel. Caller must hold the
+    kernel manager lock (reads the SPICE kernel pool).
+    """
+    delta_t_a = spice.gdpool("DELTET/DELTA_T_A", 0, 1)[0]
+    k = spice.gdpool("DELTET/K", 0, 1)[0]
+    eb = spice.gdpool("DELTET/EB", 0, 1)[0]
+    m0, m1 = spice.gdpool("DELTET/M", 0, 2)
+    # Flattened (TAI-UTC, UTC epoch) pairs, one per leap second
+    leaps = np.asarray(spice.gdpool("DELTET/DELTA_AT", 0, 400), dtype=float).reshape(-1, 2)
+
+    m = m0 + m1 * et_times
+    dta = delta_t_a + k * np.sin(m + eb * np.sin(m))
+
+    # Leap second in effect at each TAI epoch (one less than the first
+    # table entry before 1972, matching SPICE)
+    idx = np.searchsorted(leaps[:, 1] + leaps[:, 0], et_times - dta, side="right") - 1
+    delta_at = np.where(idx >= 0, leaps[np.maximum(idx, 0), 0], leaps[0, 0] - 1)
+    return dta + delta_at
+
+
+def _et_to_utc_index(et_times: np.ndarray) -> "pd.DatetimeIndex":
+    """Convert an ET array to a UTC DatetimeIndex, rounded to milliseconds.
+
+    Replaces per-point ``et2utc`` formatting and string parsing with
+    numpy timedelta arithmetic. Caller must hold the kernel manager lock.
+    """
+    import pandas as pd
+
+    utc_seconds = et_times - _deltet(et_times)
+    index = pd.DatetimeIndex(_J2000_UTC + np.round(utc_seconds * 1e9).astype("timedelta64[ns]"))
+    return index.round("ms")
+
+
+@functools.lru_cache(maxsize=64)
 def _parse_step(step: str) -> float:
-    """Parse a step string like '1h', '30m', '1d' into seconds."""
-    step = step.strip().lower()
-    if step.endswith("d"):
-        return float(step[:-1]) * 86400
-    elif step.endswith("h"):
-        return float(step[:-1]) * 3600
-    elif step.endswith("m"):
-        return float(step[:-1]) * 60
-    elif step.endswith("s"):
-        return float(step[:-1])
-    else:
-        return float(step)  # assume seconds
+    """Parse a step string like '1h', '30m', '1d' into seconds.
+
+    A bare number is taken as seconds.
+
+    Raises:
+        ValueError: If the string is not a number with an optional unit.
+    """
+    m = _STEP_RE.match(step)
+    if m is None:
+        raise ValueError(
+            f"Invalid step '{step}'. Use a number with an optional unit "
+            f"d/h/m/s, e.g. '1h', '30m', '1d', '60s'."
+        )
+    return float(m.group(1)) * _STEP_UNIT_SECONDS[m.group(2).lower()]
 
 
 def get_position(
     target: str,
     observer: str = "SUN",
-    time: str | datetime = "2024-01-01T00:00:00",
+    time: str | datetime | float = "2024-01-01T00:00:00",
     frame: str = "ECLIPJ2000",
 ) -> dict:
     """Get the position of a target relative to an observer at a single time.
@@ -125,7 +206,7 @@ def get_position(
     Args:
         target: Target body name (e.g., "PSP", "Earth", "ACE").
         observer: Observer body name (default: "SUN").
-        time: UTC time as ISO string or datetime.
+        time: UTC time as ISO string or datetime, or ET seconds past J2000.
         frame: Reference frame (default: "ECLIPJ2000").
 
     Returns:
@@ -143,7 +224,7 @@ def get_position(
         pos, lt = spice.spkpos(str(target_id), et, frame, "NONE", str(observer_id))
 
     x, y, z = float(pos[0]), float(pos[1]), float(pos[2])
-    r_km = float(np.sqrt(x**2 + y**2 + z**2))
+    r_km = math.hypot(x, y, z)
 
     return {
         "x_km": x,
@@ -162,7 +243,7 @@ def get_position(
 def get_state(
     target: str,
     observer: str = "SUN",
-    time: str | datetime = "2024-01-01T00:00:00",
+    time: str | datetime | float = "2024-01-01T00:00:00",
     frame: str = "ECLIPJ2000",
 ) -> dict:
     """Get position and velocity of a target at a single time.
@@ -170,7 +251,7 @@ def get_state(
     Args:
         target: Target body name.
         observer: Observer body name.
-        time: UTC time as ISO string or datetime.
+        time: UTC time as ISO string or datetime, or ET seconds past J2000.
         frame: Reference frame.
 
     Returns:
@@ -189,8 +270,8 @@ def get_state(
 
     x, y, z = float(state[0]), float(state[1]), float(state[2])
     vx, vy, vz = float(state[3]), float(state[4]), float(state[5])
-    r_km = float(np.sqrt(x**2 + y**2 + z**2))
-    speed = float(np.sqrt(vx**2 + vy**2 + vz**2))
+    r_km = math.hypot(x, y, z)
+    speed = math.hypot(vx, vy, vz)
 
     return {
         "x_km": x,
@@ -213,19 +294,19 @@ def get_state(
 def get_trajectory(
     target: str,
     observer: str = "SUN",
-    time_start: str | datetime = "2024-01-01",
-    time_end: str | datetime = "2024-01-31",
+    time_start: str | datetime | float = "2024-01-01",
+    time_end: str | datetime | float = "2024-01-31",
     step: str = "1h",
     frame: str = "ECLIPJ2000",
     include_velocity: bool = False,
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """Compute a trajectory (position timeseries) over a time range.
 
     Args:
         target: Target body name (e.g., "PSP", "Earth").
         observer: Observer body name (default: "SUN").
-        time_start: Start time (ISO string or datetime).
-        time_end: End time (ISO string or datetime).
+        time_start: Start time (ISO string, datetime, or ET seconds).
+        time_end: End time (ISO string, datetime, or ET seconds).
         step: Time step (e.g., "1h", "30m", "1d"). Default: "1h".
         frame: Reference frame (default: "ECLIPJ2000").
         include_velocity: If True, include vx, vy, vz columns.
@@ -234,6 +315,10 @@ def get_trajectory(
         DataFrame with DatetimeIndex and columns:
         x_km, y_km, z_km, r_km, r_au (+ vx_km_s, vy_km_s, vz_km_s if requested).
     """
+    import pandas as pd
+
+    # Validate cheap inputs before any kernel download
+    step_s = _parse_step(step)
     target_id, target_key = _resolve_body(target)
     observer_id, observer_key = _resolve_body(observer)
     _ensure_kernels(
@@ -243,40 +328,33 @@ def get_trajectory(
     )
 
     km = get_kernel_manager()
-    step_s = _parse_step(step)
 
     with km.lock:
         et_start = _to_et(time_start)
         et_end = _to_et(time_end)
 
     n_steps = max(1, int((et_end - et_start) / step_s) + 1)
-    # Cap at 100k points to prevent memory issues
-    if n_steps > 100_000:
-        step_s = (et_end - et_start) / 100_000
-        n_steps = 100_001
+    if n_steps > _MAX_TRAJECTORY_STEPS:
+        step_s = (et_end - et_start) / _MAX_TRAJECTORY_STEPS
+        n_steps = _MAX_TRAJECTORY_STEPS + 1
         logger.warning("Trajectory capped at 100k points; step adjusted to %.1fs", step_s)
 
     et_times = np.linspace(et_start, et_end, n_steps)
 
-    # Compute positions (and optionally velocities) under lock
-    positions = np.empty((n_steps, 3))
-    velocities = np.empty((n_steps, 3)) if include_velocity else None
-    utc_times = []
-
+    # Compute positions (and optionally velocities) under lock. spiceypy
+    # loops over an ET array inside a single call and returns (N, 3|6) arrays.
+    velocities = None
     with km.lock:
-        for i, et in enumerate(et_times):
-            if include_velocity:
-                state, _ = spice.spkezr(str(target_id), et, frame, "NONE", str(observer_id))
-                positions[i] = state[:3]
-                velocities[i] = state[3:]
-            else:
-                pos, _ = spice.spkpos(str(target_id), et, frame, "NONE", str(observer_id))
-                positions[i] = pos
-            utc_times.append(spice.et2utc(et, "ISOC", 3))
-
-    # Build DataFrame
-    index = pd.to_datetime(utc_times)
-    r_km = np.sqrt(np.sum(positions**2, axis=1))
+        if include_velocity:
+            states, _ = spice.spkezr(str(target_id), et_times, frame, "NONE", str(observer_id))
+            positions = states[:, :3]
+            velocities = states[:, 3:]
+        else:
+            positions, _ = spice.spkpos(str(target_id), et_times, frame, "NONE", str(observer_id))
+        index = _et_to_utc_index(et_times)
+
+    # Build DataFrame; einsum fuses the squared row sums into one pass
+    r_km = np.sqrt(np.einsum("ij,ij->i", positions, positions))
 
     data = {
         "x_km": positions[:, 0],
@@ -297,8 +375,7 @@ def get_trajectory(
     logger.info(
         "Computed trajectory: %s rel. %s, %d points, %s to %s",
         target_key, observer_key, n_steps,
-        utc_times[0] if utc_times else "?",
-        utc_times[-1] if utc_times else "?",
+        index[0], index[-1],
     )
 
     return df
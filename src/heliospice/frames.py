@@ -7,7 +7,9 @@ RTN (Radial-Tangential-Normal) is computed manually from the
 spacecraft position vector relative to the Sun.
 """
 
+import functools
 import logging
+import types
 
 import numpy as np
 import spiceypy as spice
@@ -112,12 +114,16 @@ FRAME_DESCRIPTIONS: dict[str, dict[str, str]] = {
 }
 
 # Frames that require manual computation (not standard SPICE pxform)
-_MANUAL_FRAMES = {"RTN"}
+_MANUAL_FRAMES = frozenset({"RTN"})
 
 # Frames that are standard SPICE and can use pxform directly
-_SPICE_NATIVE_FRAMES = {"J2000", "ECLIPJ2000", "ECLIPB1950"}
+_SPICE_NATIVE_FRAMES = frozenset({"J2000", "ECLIPJ2000", "ECLIPB1950"})
 
+# Read-only, pre-normalized (uppercase) view of FRAME_ALIASES for lookups
+_FRAME_LOOKUP = types.MappingProxyType({k.upper(): v for k, v in FRAME_ALIASES.items()})
 
+
+@functools.lru_cache(maxsize=256)
 def _resolve_frame(name: str) -> str:
     """Resolve a frame name through aliases.
 
@@ -131,30 +137,43 @@ def _resolve_frame(name: str) -> str:
         KeyError: If the frame name is not recognized.
     """
     key = name.strip().upper()
-    if key in FRAME_ALIASES:
-        return FRAME_ALIASES[key]
-    # Try as-is (SPICE might know it)
-    return key
+    # Unknown names pass through as-is (SPICE might know them)
+    return _FRAME_LOOKUP.get(key, key)
 
 
-def _compute_rtn_matrix(spacecraft: str, time_et: float) -> np.ndarray:
-    """Compute the RTN rotation matrix for a spacecraft at a given time.
+# Sun's north pole in J2000 (IAU_SUN pole: RA=286.13 deg, Dec=63.87 deg)
+_SUN_POLE_RA_RAD = np.radians(286.13)
+_SUN_POLE_DEC_RAD = np.radians(63.87)
+_SUN_NORTH_J2000 = np.array([
+    np.cos(_SUN_POLE_DEC_RAD) * np.cos(_SUN_POLE_RA_RAD),
+    np.cos(_SUN_POLE_DEC_RAD) * np.sin(_SUN_POLE_RA_RAD),
+    np.sin(_SUN_POLE_DEC_RAD),
+])
+
+# T axis used when the spacecraft lies on the Sun's rotation axis
+_RTN_FALLBACK_T = np.array([0.0, 1.0, 0.0])
+
+
+def _compute_rtn_matrices(spacecraft: str, times_et: np.ndarray) -> np.ndarray:
+    """Compute RTN rotation matrices for a spacecraft at many times.
 
     RTN is defined relative to the Sun:
     - R (radial): unit vector from Sun to spacecraft
     - T (tangential): cross(Sun_north, R), normalized
     - N (normal): cross(R, T)
 
-    The returned matrix transforms from J2000 to RTN:
-        v_rtn = M @ v_j2000
+    Each returned matrix transforms from J2000 to RTN:
+        v_rtn = M[i] @ v_j2000
 
     Args:
         spacecraft: Spacecraft name or NAIF ID string.
-        time_et: SPICE ephemeris time.
+        times_et: 1-D array of SPICE ephemeris times.
 
     Returns:
-        3x3 rotation matrix (J2000 -> RTN).
+        (N, 3, 3) array of rotation matrices (J2000 -> RTN).
     """
+    times_et = np.atleast_1d(np.asarray(times_et, dtype=float))
+
     try:
         sc_id, sc_key = resolve_mission(spacecraft)
     except KeyError:
@@ -167,70 +186,110 @@ def _compute_rtn_matrix(spacecraft: str, time_et: float) -> np.ndarray:
         km.ensure_mission_kernels(sc_key)
     elif sc_key in SEGMENTED_MISSIONS:
         from datetime import date
-        # LSK already loaded — convert ET to UTC date for segment lookup
+        # LSK already loaded — convert ET to UTC dates for segment lookup
         with km.lock:
-            utc_str = spice.et2utc(time_et, "ISOC", 0)
-        t_date = date.fromisoformat(utc_str[:10])
-        km.ensure_segmented_kernels(sc_key, t_date, t_date)
+            first = spice.et2utc(float(times_et.min()), "ISOC", 0)
+            last = spice.et2utc(float(times_et.max()), "ISOC", 0)
+        km.ensure_segmented_kernels(
+            sc_key, date.fromisoformat(first[:10]), date.fromisoformat(last[:10])
+        )
 
     with km.lock:
-        # Spacecraft position relative to Sun in J2000
-        pos_j2000, _ = spice.spkpos(str(sc_id), time_et, "J2000", "NONE", "10")
-
-    pos = np.array(pos_j2000, dtype=float)
-    r_hat = pos / np.linalg.norm(pos)
-
-    # Sun's north pole in J2000 (approximately Z-axis of ecliptic + obliquity)
-    # Use IAU_SUN pole: RA=286.13 deg, Dec=63.87 deg (J2000)
-    ra_rad = np.radians(286.13)
-    dec_rad = np.radians(63.87)
-    sun_north = np.array([
-        np.cos(dec_rad) * np.cos(ra_rad),
-        np.cos(dec_rad) * np.sin(ra_rad),
-        np.sin(dec_rad),
-    ])
-
-    t_hat = np.cross(sun_north, r_hat)
-    t_norm = np.linalg.norm(t_hat)
-    if t_norm < 1e-10:
-        # Degenerate case: spacecraft along Sun's rotation axis
-        t_hat = np.array([0.0, 1.0, 0.0])
-    else:
-        t_hat = t_hat / t_norm
+        # Spacecraft positions relative to Sun in J2000, one batched call
+        pos, _ = spice.spkpos(str(sc_id), times_et, "J2000", "NONE", "10")
+
+    return _rtn_basis(np.asarray(pos, dtype=float).reshape(-1, 3))
+
+
+def _rtn_basis(pos: np.ndarray) -> np.ndarray:
+    """Build (N, 3, 3) J2000 -> RTN matrices from (N, 3) Sun->spacecraft vectors."""
+    # Row norms via einsum avoid np.linalg.norm's per-call dispatch overhead
+    r_hat = pos / np.sqrt(np.einsum("ij,ij->i", pos, pos))[:, None]
+
+    t_hat = np.cross(_SUN_NORTH_J2000, r_hat)
+    t_norm = np.sqrt(np.einsum("ij,ij->i", t_hat, t_hat))[:, None]
+    # Degenerate case: spacecraft along Sun's rotation axis. Select the
+    # fallback axis instead of branching; the guarded divisor keeps the
+    # discarded lane finite.
+    t_hat = np.where(t_norm < 1e-10, _RTN_FALLBACK_T, t_hat / np.maximum(t_norm, 1e-10))
 
     n_hat = np.cross(r_hat, t_hat)
-    n_hat = n_hat / np.linalg.norm(n_hat)
+    n_hat = n_hat / np.sqrt(np.einsum("ij,ij->i", n_hat, n_hat))[:, None]
 
-    # Rotation matrix: rows are the RTN basis vectors in J2000
-    return np.array([r_hat, t_hat, n_hat])
+    # Rotation matrices: rows are the RTN basis vectors in J2000
+    return np.stack([r_hat, t_hat, n_hat], axis=1)
 
 
-def transform_vector(
-    vector: list | np.ndarray,
-    time: str,
+def _compute_rtn_matrix(spacecraft: str, time_et: float) -> np.ndarray:
+    """Compute the RTN rotation matrix for a spacecraft at a single time.
+
+    See ``_compute_rtn_matrices`` for the frame definition.
+
+    Args:
+        spacecraft: Spacecraft name or NAIF ID string.
+        time_et: SPICE ephemeris time.
+
+    Returns:
+        3x3 rotation matrix (J2000 -> RTN).
+    """
+    return _compute_rtn_matrices(spacecraft, np.array([time_et]))[0]
+
+
+def _pxform_batch(src: str, dst: str, times_et: np.ndarray) -> np.ndarray:
+    """Return (N, 3, 3) SPICE rotation matrices src -> dst, one lock acquisition."""
+    km = get_kernel_manager()
+    with km.lock:
+        return np.array([spice.pxform(src, dst, et) for et in times_et], dtype=float)
+
+
+def _to_et(time: str | float) -> float:
+    """UTC string -> ET via utc2et; numeric input is already ET. Caller holds the lock."""
+    if isinstance(time, str):
+        return spice.utc2et(time)
+    return float(time)
+
+
+def _apply_matrices(mats: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Apply (M, 3, 3) matrices to (N, 3) vectors; M is 1 or N."""
+    return np.einsum("...ij,...j->...i", mats, vectors)
+
+
+def transform_vector_batch(
+    vectors: list | np.ndarray,
+    times: str | float | list[str] | np.ndarray,
     from_frame: str,
     to_frame: str,
     spacecraft: str = "",
 ) -> np.ndarray:
-    """Transform a 3-vector between coordinate frames.
+    """Transform many 3-vectors between coordinate frames.
+
+    With a single time, one rotation matrix is computed and applied to
+    every vector. With one time per vector, all ET conversions and
+    pxform calls share a single lock acquisition and RTN matrices come
+    from one batched spkpos.
 
     Args:
-        vector: 3-element vector [x, y, z].
-        time: UTC time string (ISO 8601).
+        vectors: (N, 3) array of vectors.
+        times: One UTC time string (or ET seconds) for all vectors, or N
+            of them.
         from_frame: Source frame name.
         to_frame: Target frame name.
         spacecraft: Spacecraft name (required for RTN transforms).
 
     Returns:
-        Transformed 3-vector as numpy array.
+        Transformed (N, 3) numpy array.
 
     Raises:
-        ValueError: If RTN is used without specifying a spacecraft.
+        ValueError: If shapes mismatch or RTN is used without a spacecraft.
         KeyError: If a frame cannot be resolved.
     """
-    v = np.asarray(vector, dtype=float)
-    if v.shape != (3,):
-        raise ValueError(f"Expected 3-element vector, got shape {v.shape}")
+    v = np.asarray(vectors, dtype=float)
+    if v.ndim != 2 or v.shape[1] != 3:
+        raise ValueError(f"Expected (N, 3) array of vectors, got shape {v.shape}")
+
+    single_time = np.ndim(times) == 0
+    if not single_time and len(times) != len(v):
+        raise ValueError(f"Got {len(times)} times for {len(v)} vectors")
 
     src = _resolve_frame(from_frame)
     dst = _resolve_frame(to_frame)
@@ -238,53 +297,81 @@ def transform_vector(
     if src == dst:
         return v
 
+    if (src == "RTN" or dst == "RTN") and not spacecraft:
+        raise ValueError("spacecraft parameter is required for RTN transforms")
+
     km = get_kernel_manager()
-    km.ensure_generic_kernels()
+    # Built-in inertial frames need only the LSK (for UTC -> ET); body-fixed
+    # and FK-defined frames need the PCK, SPK and frame kernels as well
+    if src in _SPICE_NATIVE_FRAMES and dst in _SPICE_NATIVE_FRAMES:
+        km.ensure_lsk()
+    else:
+        km.ensure_generic_kernels()
 
     with km.lock:
-        et = spice.utc2et(time)
+        if single_time:
+            ets = np.array([_to_et(times)])
+        else:
+            ets = np.array([_to_et(t) for t in times])
 
     # Handle RTN cases
     if src == "RTN" or dst == "RTN":
-        if not spacecraft:
-            raise ValueError("spacecraft parameter is required for RTN transforms")
-
-        rtn_mat = _compute_rtn_matrix(spacecraft, et)  # J2000 -> RTN
-
-        if src == "RTN" and dst == "RTN":
-            return v
+        rtn_mats = _compute_rtn_matrices(spacecraft, ets)  # J2000 -> RTN
 
         if src == "RTN":
-            # RTN -> J2000 -> dst
-            v_j2000 = rtn_mat.T @ v  # RTN -> J2000 (inverse = transpose)
+            # RTN -> J2000 -> dst (inverse = transpose)
+            v_j2000 = _apply_matrices(rtn_mats.transpose(0, 2, 1), v)
             if dst in _SPICE_NATIVE_FRAMES:
-                with km.lock:
-                    mat = spice.pxform("J2000", dst, et)
-                return np.array(mat) @ v_j2000
-            else:
-                return v_j2000
-
-        if dst == "RTN":
-            # src -> J2000 -> RTN
-            if src in _SPICE_NATIVE_FRAMES:
-                with km.lock:
-                    mat = spice.pxform(src, "J2000", et)
-                v_j2000 = np.array(mat) @ v
-            else:
-                v_j2000 = v  # assume already J2000-compatible
-            return rtn_mat @ v_j2000
+                return _apply_matrices(_pxform_batch("J2000", dst, ets), v_j2000)
+            return v_j2000
+
+        # src -> J2000 -> RTN
+        if src in _SPICE_NATIVE_FRAMES:
+            v_j2000 = _apply_matrices(_pxform_batch(src, "J2000", ets), v)
+        else:
+            v_j2000 = v  # assume already J2000-compatible
+        return _apply_matrices(rtn_mats, v_j2000)
 
     # Standard SPICE frame-to-frame
-    with km.lock:
-        try:
-            mat = spice.pxform(src, dst, et)
-        except Exception as e:
-            raise KeyError(
-                f"Cannot transform from '{src}' to '{dst}' via SPICE: {e}. "
-                f"Available frames: {', '.join(sorted(FRAME_ALIASES.keys()))}"
-            ) from e
-
-    return np.array(mat) @ v
+    try:
+        mats = _pxform_batch(src, dst, ets)
+    except Exception as e:
+        raise KeyError(
+            f"Cannot transform from '{src}' to '{dst}' via SPICE: {e}. "
+            f"Available frames: {', '.join(sorted(FRAME_ALIASES.keys()))}"
+        ) from e
+
+    return _apply_matrices(mats, v)
+
+
+def transform_vector(
+    vector: list | np.ndarray,
+    time: str | float,
+    from_frame: str,
+    to_frame: str,
+    spacecraft: str = "",
+) -> np.ndarray:
+    """Transform a 3-vector between coordinate frames.
+
+    Args:
+        vector: 3-element vector [x, y, z].
+        time: UTC time string (ISO 8601), or ET seconds past J2000.
+        from_frame: Source frame name.
+        to_frame: Target frame name.
+        spacecraft: Spacecraft name (required for RTN transforms).
+
+    Returns:
+        Transformed 3-vector as numpy array.
+
+    Raises:
+        ValueError: If RTN is used without specifying a spacecraft.
+        KeyError: If a frame cannot be resolved.
+    """
+    v = np.asarray(vector, dtype=float)
+    if v.shape != (3,):
+        raise ValueError(f"Expected 3-element vector, got shape {v.shape}")
+
+    return transform_vector_batch(v[None, :], time, from_frame, to_frame, spacecraft)[0]
 
 
 def list_available_frames() -> list[str]:
@@ -8,34 +8,98 @@ KernelManager is a thread-safe singleton that handles:
 - Tracking loaded kernels to avoid double-loading
 """
 
+import bisect
+import collections
+import functools
 import importlib.resources
+import itertools
 import json
 import logging
 import os
+import re
+import shutil
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from html.parser import HTMLParser
 from pathlib import Path
 
+import requests
 import spiceypy as spice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .missions import GENERIC_KERNELS, MISSION_KERNELS
+try:
+    from fastrlock.rlock import RLock as _FastRLock
+except ImportError:
+    _FastRLock = None
+
+from .missions import GENERIC_KERNELS, MISSION_KERNELS, SEGMENTED_MISSIONS, resolve_mission
 
 logger = logging.getLogger("heliospice")
 
+# Maximum concurrent kernel downloads (downloads are network-bound;
+# loading into the SPICE pool stays serialized)
+MAX_DOWNLOAD_WORKERS = 8
+
+# Copy buffer for streaming kernel downloads to disk
+DOWNLOAD_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Seconds a computed cache size stays valid. Downloads and deletions made
+# through the manager reset it immediately; the TTL only bounds how long
+# changes made by other processes go unnoticed.
+CACHE_SIZE_TTL = 5.0
+
+# evict_cache ranks files by their K-th most recent use (LRU-K). A use is
+# any load_kernel call or ensure_* call that needs the file, even when it
+# is already loaded. Files used fewer than K times go first, so a one-off
+# sweep over many segments cannot push out kernels that are used routinely.
+EVICTION_K = 2
+
+# Remote directory listings kept for conditional re-fetch in
+# check_remote_kernels (least recently used dropped first)
+REMOTE_LISTING_CACHE_SIZE = 16
+
 
-class _LinkExtractor(HTMLParser):
-    """Extract href attributes from <a> tags in HTML directory listings."""
+# .bsp href targets in NAIF's plain Apache directory listings (the
+# extension match is case-insensitive, so no per-link filtering is needed)
+_BSP_HREF_RE = re.compile(rb"""href\s*=\s*["']([^"']+\.bsp)["']""", re.I)
 
-    def __init__(self):
-        super().__init__()
-        self.links: list[str] = []
 
-    def handle_starttag(self, tag, attrs):
-        if tag == "a":
-            for name, value in attrs:
-                if name == "href" and value:
-                    self.links.append(value)
+@functools.lru_cache(maxsize=None)
+def _read_manifest(manifest_file: str) -> list[dict]:
+    """Parse a bundled segment manifest JSON (cached per process).
+
+    Manifests ship inside the package and do not change at runtime,
+    so each file is read and parsed at most once. Callers must not
+    mutate the returned list.
+    """
+    ref = importlib.resources.files("heliospice.manifests").joinpath(manifest_file)
+    return json.loads(ref.read_text(encoding="utf-8"))
+
+
+@functools.lru_cache(maxsize=None)
+def _manifest_files(manifest_file: str) -> tuple[str, ...]:
+    """Return the segment filenames listed in a bundled manifest (cached per process)."""
+    return tuple(seg["file"] for seg in _read_manifest(manifest_file))
+
+
+def _preallocate(f, resp) -> None:
+    """Reserve disk space for a download when its size is known up front.
+
+    Lets the filesystem allocate contiguous extents in one call instead of
+    growing the file write by write. Skipped for content-encoded responses
+    (Content-Length is the compressed size) and where posix_fallocate is
+    unavailable; failures are ignored since this is only a hint.
+    """
+    if not hasattr(os, "posix_fallocate") or resp.headers.get("Content-Encoding"):
+        return
+    try:
+        size = int(resp.headers.get("Content-Length", 0))
+        if size > 0:
+            os.posix_fallocate(f.fileno(), 0, size)
+    except (TypeError, ValueError, OSError):
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -47,7 +111,11 @@ _instance_lock = threading.Lock()
 
 
 def get_kernel_manager() -> "KernelManager":
-    """Return the KernelManager singleton."""
+    """Return the KernelManager singleton.
+
+    Double-checked: once created, the instance is returned after a single
+    global read without touching the lock.
+    """
     global _instance
     if _instance is not None:
         return _instance
@@ -67,11 +135,41 @@ class KernelManager:
     """
 
     def __init__(self, kernel_dir: Path | str | None = None):
-        self._lock = threading.RLock()
+        # fastrlock (optional) is cheaper to acquire when uncontended
+        self._lock = _FastRLock() if _FastRLock is not None else threading.RLock()
         self._loaded_kernels: set[str] = set()
+        # Read-only copy of _loaded_kernels, replaced on every write, so
+        # already-loaded checks can skip the lock
+        self._loaded_snapshot: frozenset[str] = frozenset()
+        self._lsk_loaded = False
         self._generic_loaded = False
         self._mission_kernels_loaded: set[str] = set()
         self._segmented_files_loaded: set[str] = set()
+        # Path -> resolved absolute path string (kernel paths never move)
+        self._resolved_keys: dict[Path, str] = {}
+        # mission_key -> (segments sorted by start, start dates, stop dates,
+        # running max of stop dates)
+        self._segment_index: dict[
+            str, tuple[list[dict], list[date], list[date], list[date]]
+        ] = {}
+        # Per-filename locks so concurrent callers never fetch the same file twice
+        self._download_locks: dict[str, threading.Lock] = {}
+        self._download_locks_lock = threading.Lock()
+        self._session: requests.Session | None = None
+        # Guards session creation only. Must not be the SPICE lock: download
+        # workers create the session while a caller may hold km.lock.
+        self._session_lock = threading.Lock()
+        # Opt-in: HEAD-check cached file sizes against the server
+        self._validate_cache = os.environ.get("HELIOSPICE_VALIDATE_CACHE", "") == "1"
+        # (time.monotonic() when computed, total bytes) or None if stale
+        self._cache_size: tuple[float, int] | None = None
+        # filename -> wall-clock times of its last EVICTION_K uses
+        self._use_history: dict[str, collections.deque[float]] = {}
+        # directory URL -> (conditional request headers, parsed .bsp names)
+        self._remote_listings: collections.OrderedDict[
+            str, tuple[dict[str, str], tuple[str, ...]]
+        ] = collections.OrderedDict()
+        self._remote_listings_lock = threading.Lock()
 
         if kernel_dir is not None:
             self._kernel_dir = Path(kernel_dir)
@@ -92,6 +190,27 @@ class KernelManager:
     def kernel_dir(self) -> Path:
         return self._kernel_dir
 
+    def _get_session(self) -> requests.Session:
+        """Return a shared requests.Session (created on first use).
+
+        Reusing one session keeps connections to NAIF alive across
+        downloads instead of paying a TCP + TLS handshake per file.
+        """
+        if self._session is not None:
+            return self._session
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=16,
+                    max_retries=Retry(total=3, backoff_factor=0.5),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
     # ------------------------------------------------------------------
     # Download
     # ------------------------------------------------------------------
@@ -110,14 +229,54 @@ class KernelManager:
             RuntimeError: If the download fails.
         """
         local_path = self._kernel_dir / filename
-        if local_path.exists() and local_path.stat().st_size > 0:
+        if self._is_cached(url, local_path):
             logger.debug("Kernel cached: %s", filename)
             return local_path
 
+        with self._download_locks_lock:
+            file_lock = self._download_locks.setdefault(filename, threading.Lock())
+        with file_lock:
+            # Another thread may have finished this file while we waited
+            if self._is_cached(url, local_path):
+                logger.debug("Kernel cached: %s", filename)
+                return local_path
+            return self._fetch_kernel(url, filename, local_path)
+
+    def _is_cached(self, url: str, local_path: Path) -> bool:
+        """Return True if local_path holds a usable copy of url.
+
+        By default any non-empty file counts. With HELIOSPICE_VALIDATE_CACHE=1
+        the size is also compared against the server's Content-Length via a
+        HEAD request; if the server can't be reached the cached file is trusted.
+        """
+        try:
+            size = local_path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if size == 0:
+            return False
+        if not self._validate_cache:
+            return True
+        try:
+            resp = self._get_session().head(url, timeout=10, allow_redirects=True)
+            resp.raise_for_status()
+            remote_size = int(resp.headers["Content-Length"])
+        except Exception as e:
+            logger.debug("Cache validation skipped for %s: %s", local_path.name, e)
+            return True
+        if remote_size != size:
+            logger.info(
+                "Cached kernel %s is %d bytes, server has %d; re-downloading",
+                local_path.name, size, remote_size,
+            )
+            return False
+        return True
+
+    def _fetch_kernel(self, url: str, filename: str, local_path: Path) -> Path:
+        """Fetch a kernel to local_path. Caller must hold the file's download lock."""
         logger.info("Downloading kernel: %s", filename)
-        import requests
         try:
-            resp = requests.get(url, stream=True, timeout=300)
+            resp = self._get_session().get(url, stream=True, timeout=300)
             resp.raise_for_status()
         except Exception as e:
             raise RuntimeError(f"Failed to download kernel {filename} from {url}: {e}") from e
@@ -125,33 +284,73 @@ class KernelManager:
         # Write to temp file then rename for atomicity
         tmp_path = local_path.with_suffix(".tmp")
         try:
-            with open(tmp_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=1024 * 1024):
-                    f.write(chunk)
-            tmp_path.rename(local_path)
+            resp.raw.decode_content = True
+            with open(tmp_path, "wb", buffering=DOWNLOAD_CHUNK_BYTES) as f:
+                _preallocate(f, resp)
+                shutil.copyfileobj(resp.raw, f, length=DOWNLOAD_CHUNK_BYTES)
+                # Drop any preallocated tail the body didn't fill
+                f.truncate()
+                # Make the data durable before publishing it under the final name
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, local_path)
         except Exception:
             tmp_path.unlink(missing_ok=True)
             raise
+        finally:
+            self._cache_size = None
 
         logger.info("Downloaded kernel: %s (%d bytes)", filename, local_path.stat().st_size)
         return local_path
 
+    def download_kernels(self, jobs: list[tuple[str, str]]) -> list[Path]:
+        """Download several kernels concurrently.
+
+        Args:
+            jobs: List of (url, filename) pairs.
+
+        Returns:
+            Paths to the cached files, in the same order as jobs.
+
+        Raises:
+            RuntimeError: If any download fails.
+        """
+        if len(jobs) <= 1:
+            return [self.download_kernel(url, filename) for url, filename in jobs]
+        with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(jobs))) as ex:
+            return list(ex.map(lambda job: self.download_kernel(*job), jobs))
+
     # ------------------------------------------------------------------
     # Load / unload
     # ------------------------------------------------------------------
 
+    def _kernel_key(self, path: Path) -> str:
+        """Return the resolved path string used to track a loaded kernel.
+
+        Memoized so repeated loads skip the realpath syscalls.
+        """
+        key = self._resolved_keys.get(path)
+        if key is None:
+            key = str(path.resolve())
+            self._resolved_keys[path] = key
+        return key
+
     def load_kernel(self, path: Path) -> None:
         """Load a kernel into the SPICE pool (idempotent).
 
         Args:
             path: Path to the kernel file.
         """
-        key = str(path.resolve())
+        key = self._kernel_key(path)
+        self._record_use(path.name)
+        if key in self._loaded_snapshot:
+            return
         with self._lock:
             if key in self._loaded_kernels:
                 return
             spice.furnsh(key)
             self._loaded_kernels.add(key)
+            self._loaded_snapshot = frozenset(self._loaded_kernels)
             logger.debug("Loaded kernel: %s", path.name)
 
     def unload_all(self) -> None:
@@ -159,20 +358,46 @@ class KernelManager:
         with self._lock:
             spice.kclear()
             self._loaded_kernels.clear()
+            self._loaded_snapshot = frozenset()
+            self._lsk_loaded = False
             self._generic_loaded = False
             self._mission_kernels_loaded.clear()
             self._segmented_files_loaded.clear()
             logger.info("Unloaded all SPICE kernels")
 
+    def _record_use(self, filename: str) -> None:
+        """Record a use of a kernel file for evict_cache's LRU-K ranking."""
+        history = self._use_history.get(filename)
+        if history is None:
+            history = self._use_history.setdefault(
+                filename, collections.deque(maxlen=EVICTION_K)
+            )
+        history.append(time.time())
+
     def list_loaded(self) -> list[str]:
         """Return list of currently loaded kernel file names."""
         with self._lock:
-            return [Path(k).name for k in sorted(self._loaded_kernels)]
+            return [os.path.basename(k) for k in sorted(self._loaded_kernels)]
 
     # ------------------------------------------------------------------
     # High-level ensure methods
     # ------------------------------------------------------------------
 
+    def ensure_lsk(self) -> None:
+        """Download and load only the leapseconds kernel.
+
+        Enough for UTC <-> ET conversion (utc2et, et2utc) and inertial
+        frame rotations, without fetching the ~31 MB planetary SPK.
+        Idempotent — safe to call multiple times.
+        """
+        filename = "naif0012.tls"
+        if self._lsk_loaded:
+            self._record_use(filename)
+            return
+        path = self.download_kernel(GENERIC_KERNELS[filename], filename)
+        self.load_kernel(path)
+        self._lsk_loaded = True
+
     def ensure_generic_kernels(self) -> None:
         """Download and load generic kernels (LSK, PCK, planetary SPK).
 
@@ -180,11 +405,13 @@ class KernelManager:
         Loading order: LSK -> PCK -> SPK (dependencies first).
         """
         if self._generic_loaded:
+            for filename in GENERIC_KERNELS:
+                self._record_use(filename)
             return
 
         # Order matters: LSK first (time conversion), then PCK, then SPK
+        self.ensure_lsk()
         ordered_files = [
-            "naif0012.tls",   # Leap seconds
             "pck00011.tpc",   # Planetary constants
             "gm_de440.tpc",   # Gravitational parameters
             "de440s.bsp",     # Planetary ephemerides
@@ -212,13 +439,14 @@ class KernelManager:
             KeyError: If no kernels are defined for this mission.
         """
         if mission_key in self._mission_kernels_loaded:
+            for filename in MISSION_KERNELS.get(mission_key, ()):
+                self._record_use(filename)
             return
 
         self.ensure_generic_kernels()
 
         kernels = MISSION_KERNELS.get(mission_key)
         if kernels is None:
-            from .missions import SEGMENTED_MISSIONS
             if mission_key in SEGMENTED_MISSIONS:
                 raise KeyError(
                     f"Mission '{mission_key}' uses segmented kernels. "
@@ -229,8 +457,9 @@ class KernelManager:
                 f"Available: {', '.join(sorted(MISSION_KERNELS.keys()))}"
             )
 
-        for filename, url in kernels.items():
-            path = self.download_kernel(url, filename)
+        # Download in parallel, then load in the configured order
+        paths = self.download_kernels([(url, filename) for filename, url in kernels.items()])
+        for path in paths:
             self.load_kernel(path)
 
         self._mission_kernels_loaded.add(mission_key)
@@ -249,10 +478,43 @@ class KernelManager:
         Returns:
             List of segment dicts with keys: file, url, start, stop.
         """
-        from .missions import SEGMENTED_MISSIONS
-        manifest_file = SEGMENTED_MISSIONS[mission_key]
-        ref = importlib.resources.files("heliospice.manifests").joinpath(manifest_file)
-        return json.loads(ref.read_text(encoding="utf-8"))
+        return _read_manifest(SEGMENTED_MISSIONS[mission_key])
+
+    def _get_segment_index(
+        self, mission_key: str
+    ) -> tuple[list[dict], list[date], list[date], list[date]]:
+        """Return a mission's segments sorted by start, with parsed dates.
+
+        Built once per mission so coverage queries compare ``date``
+        objects instead of re-parsing ISO strings on every call. The
+        running max of stop dates is non-decreasing even when segments
+        overlap, so it can be bisected alongside the start dates.
+
+        Args:
+            mission_key: Canonical mission key (e.g., "CASSINI").
+
+        Returns:
+            Tuple of (segments, start dates, stop dates, running max of
+            stop dates), index-aligned.
+        """
+        index = self._segment_index.get(mission_key)
+        if index is None:
+            parsed = sorted(
+                (
+                    (date.fromisoformat(seg["start"]), date.fromisoformat(seg["stop"]), seg)
+                    for seg in self._load_manifest(mission_key)
+                ),
+                key=lambda item: item[0],
+            )
+            stops = [stop for _, stop, _ in parsed]
+            index = (
+                [seg for _, _, seg in parsed],
+                [start for start, _, _ in parsed],
+                stops,
+                list(itertools.accumulate(stops, max)),
+            )
+            self._segment_index[mission_key] = index
+        return index
 
     def ensure_segmented_kernels(
         self, mission_key: str, time_start: date, time_end: date
@@ -271,21 +533,22 @@ class KernelManager:
         """
         self.ensure_generic_kernels()
 
-        manifest = self._load_manifest(mission_key)
+        segments, starts, stops, max_stops = self._get_segment_index(mission_key)
 
-        # Find segments overlapping [time_start, time_end]
-        matching = []
-        for seg in manifest:
-            seg_start = date.fromisoformat(seg["start"])
-            seg_stop = date.fromisoformat(seg["stop"])
-            if seg_start <= time_end and seg_stop >= time_start:
-                matching.append(seg)
+        # Segments before lo all stop before time_start; segments from hi
+        # on all start after time_end. Only [lo, hi) needs checking.
+        lo = bisect.bisect_left(max_stops, time_start)
+        hi = bisect.bisect_right(starts, time_end)
+        matching = [
+            segments[i] for i in range(lo, hi)
+            if stops[i] >= time_start
+        ]
 
         if not matching:
             # Build coverage summary for error message
-            if manifest:
-                first = manifest[0]["start"]
-                last = manifest[-1]["stop"]
+            if segments:
+                first = starts[0].isoformat()
+                last = max_stops[-1].isoformat()
                 raise ValueError(
                     f"No kernel segments for {mission_key} cover "
                     f"{time_start} to {time_end}. "
@@ -296,13 +559,17 @@ class KernelManager:
                     f"Manifest for {mission_key} is empty — no segments available."
                 )
 
+        pending = []
         for seg in matching:
-            filename = seg["file"]
-            if filename in self._segmented_files_loaded:
-                continue
-            path = self.download_kernel(seg["url"], filename)
+            if seg["file"] in self._segmented_files_loaded:
+                self._record_use(seg["file"])
+            else:
+                pending.append(seg)
+        # Download in parallel, then load in manifest (time) order
+        paths = self.download_kernels([(seg["url"], seg["file"]) for seg in pending])
+        for seg, path in zip(pending, paths):
             self.load_kernel(path)
-            self._segmented_files_loaded.add(filename)
+            self._segmented_files_loaded.add(seg["file"])
 
         logger.info(
             "Segmented kernels loaded for %s: %d segments (%s to %s)",
@@ -317,7 +584,9 @@ class KernelManager:
     def check_remote_kernels(self, mission_key: str) -> dict:
         """Check a remote NAIF directory for .bsp files not in the configured set.
 
-        Only works for single-file missions (not segmented).
+        Only works for single-file missions (not segmented). Listings seen
+        before are re-fetched with a conditional GET, so an unchanged
+        directory costs a 304 instead of a full page download and parse.
 
         Args:
             mission_key: Canonical mission key (e.g., "PSP", "JUNO").
@@ -329,7 +598,6 @@ class KernelManager:
         Raises:
             KeyError: If mission_key is segmented or has no kernels defined.
         """
-        from .missions import SEGMENTED_MISSIONS
 
         if mission_key in SEGMENTED_MISSIONS:
             raise KeyError(
@@ -352,34 +620,46 @@ class KernelManager:
             parent = url.rsplit("/", 1)[0] + "/"
             parent_urls[parent] = None
 
-        import requests
-
-        directories = []
-        all_other: list[str] = []
+        session = self._get_session()
 
-        for dir_url in parent_urls:
+        def _list_dir(dir_url: str) -> dict:
             entry: dict = {"url": dir_url}
+            with self._remote_listings_lock:
+                cached = self._remote_listings.get(dir_url)
+                if cached is not None:
+                    self._remote_listings.move_to_end(dir_url)
             try:
-                resp = requests.get(dir_url, timeout=30)
-                resp.raise_for_status()
-                parser = _LinkExtractor()
-                parser.feed(resp.text)
-                bsp_files = sorted(
-                    link for link in parser.links
-                    if link.lower().endswith(".bsp")
-                )
-                entry["all_bsp_files"] = bsp_files
+                # Revalidate a previously seen listing; a 304 reuses its parse
+                resp = session.get(dir_url, timeout=30, headers=cached[0] if cached else {})
+                if cached is not None and resp.status_code == 304:
+                    files = cached[1]
+                else:
+                    resp.raise_for_status()
+                    files = tuple(sorted(
+                        m.group(1).decode("ascii", "ignore")
+                        for m in _BSP_HREF_RE.finditer(resp.content)
+                    ))
+                    self._remember_listing(dir_url, resp.headers, files)
+                entry["all_bsp_files"] = list(files)
             except Exception as e:
                 entry["all_bsp_files"] = []
                 entry["error"] = str(e)
-                bsp_files = []
+            return entry
 
-            directories.append(entry)
-
-            # Files in directory but not in configured set
-            for f in bsp_files:
-                if f not in configured_files:
-                    all_other.append(f)
+        # Directory fetches are independent; run them concurrently
+        if len(parent_urls) <= 1:
+            directories = [_list_dir(url) for url in parent_urls]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_DOWNLOAD_WORKERS, len(parent_urls))
+            ) as ex:
+                directories = list(ex.map(_list_dir, parent_urls))
+
+        # Files in directories but not in configured set
+        all_other = [
+            f for entry in directories for f in entry["all_bsp_files"]
+            if f not in configured_files
+        ]
 
         return {
             "mission": mission_key,
@@ -388,38 +668,74 @@ class KernelManager:
             "other_files": sorted(set(all_other)),
         }
 
+    def _remember_listing(self, dir_url: str, headers, files: tuple[str, ...]) -> None:
+        """Keep a parsed directory listing with its ETag/Last-Modified validators."""
+        validators = {}
+        if headers.get("ETag"):
+            validators["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        with self._remote_listings_lock:
+            if not validators:
+                self._remote_listings.pop(dir_url, None)
+                return
+            self._remote_listings[dir_url] = (validators, files)
+            self._remote_listings.move_to_end(dir_url)
+            while len(self._remote_listings) > REMOTE_LISTING_CACHE_SIZE:
+                self._remote_listings.popitem(last=False)
+
     # ------------------------------------------------------------------
     # Cache management
     # ------------------------------------------------------------------
 
     @staticmethod
     def _build_file_to_mission_map() -> dict[str, str]:
-        """Build a mapping from kernel filename to mission key."""
-        from .missions import GENERIC_KERNELS, SEGMENTED_MISSIONS
-        file_map: dict[str, str] = {}
-        for fname in GENERIC_KERNELS:
-            file_map[fname] = "GENERIC"
+        """Build a mapping from kernel filename to mission key.
+
+        The kernel tables are read on every call, so kernels registered in
+        GENERIC_KERNELS, MISSION_KERNELS or SEGMENTED_MISSIONS after import
+        are classified too. Only the bundled manifests' filename lists are
+        cached, since those never change at runtime.
+        """
+        file_map: dict[str, str] = dict.fromkeys(GENERIC_KERNELS, "GENERIC")
         for mission_key, kernels in MISSION_KERNELS.items():
             for fname in kernels:
                 file_map[fname] = mission_key
         for mission_key, manifest_file in SEGMENTED_MISSIONS.items():
             try:
-                ref = importlib.resources.files("heliospice.manifests").joinpath(manifest_file)
-                manifest = json.loads(ref.read_text(encoding="utf-8"))
-                for seg in manifest:
-                    file_map[seg["file"]] = mission_key
+                file_map.update(dict.fromkeys(_manifest_files(manifest_file), mission_key))
             except Exception:
                 pass
         return file_map
 
+    def _scan_cache(self) -> list[os.DirEntry]:
+        """List cached kernel files, skipping partial .tmp downloads.
+
+        Uses os.scandir so file type comes from the directory listing and
+        each entry's stat() result is cached after the first call.
+        """
+        try:
+            with os.scandir(self._kernel_dir) as it:
+                return [
+                    e for e in it
+                    if not e.name.endswith(".tmp") and e.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
     def get_cache_size_bytes(self) -> int:
-        """Return total size of cached kernel files in bytes."""
-        total = 0
-        if self._kernel_dir.exists():
-            for f in self._kernel_dir.iterdir():
-                if f.is_file() and not f.name.endswith(".tmp"):
-                    total += f.stat().st_size
-        return total
+        """Return total size of cached kernel files in bytes.
+
+        The result is reused for up to CACHE_SIZE_TTL seconds, so tools
+        that report cache size on every response do not rescan the
+        directory each time.
+        """
+        cached = self._cache_size
+        if cached is not None and time.monotonic() - cached[0] < CACHE_SIZE_TTL:
+            return cached[1]
+        size = sum(e.stat().st_size for e in self._scan_cache())
+        self._cache_size = (time.monotonic(), size)
+        return size
 
     def get_cache_info(self) -> dict:
         """Return cache summary grouped by mission.
@@ -428,29 +744,29 @@ class KernelManager:
             Dict with kernel_dir, total_size_mb, file_count,
             and missions dict mapping mission keys to their cached files.
         """
-        files = []
-        if self._kernel_dir.exists():
-            files = [
-                f for f in self._kernel_dir.iterdir()
-                if f.is_file() and not f.name.endswith(".tmp")
-            ]
-        total = sum(f.stat().st_size for f in files)
-
+        # One stat per file; sizes accumulate in bytes and round on output
+        entries = sorted((e.name, e.stat().st_size) for e in self._scan_cache())
+        total = 0
         file_map = self._build_file_to_mission_map()
+        mission_bytes: dict[str, int] = {}
         missions: dict[str, dict] = {}
-        for f in sorted(files):
-            mission = file_map.get(f.name, "UNKNOWN")
-            if mission not in missions:
-                missions[mission] = {"size_mb": 0.0, "file_count": 0, "files": []}
-            size_mb = round(f.stat().st_size / (1024 * 1024), 2)
-            missions[mission]["size_mb"] = round(missions[mission]["size_mb"] + size_mb, 2)
-            missions[mission]["file_count"] += 1
-            missions[mission]["files"].append({"name": f.name, "size_mb": size_mb})
+        for name, size in entries:
+            total += size
+            mission = file_map.get(name, "UNKNOWN")
+            group = missions.get(mission)
+            if group is None:
+                group = missions[mission] = {"size_mb": 0.0, "file_count": 0, "files": []}
+                mission_bytes[mission] = 0
+            mission_bytes[mission] += size
+            group["file_count"] += 1
+            group["files"].append({"name": name, "size_mb": round(size / (1024 * 1024), 2)})
+        for mission, group in missions.items():
+            group["size_mb"] = round(mission_bytes[mission] / (1024 * 1024), 2)
 
         return {
             "kernel_dir": str(self._kernel_dir),
             "total_size_mb": round(total / (1024 * 1024), 2),
-            "file_count": len(files),
+            "file_count": len(entries),
             "missions": missions,
         }
 
@@ -468,36 +784,45 @@ class KernelManager:
         deleted = []
         errors = []
         freed = 0
+        file_map = self._build_file_to_mission_map()
+        invalidated_missions: set[str] = set()
 
         with self._lock:
             for fname in filenames:
                 path = self._kernel_dir / fname
-                if not path.exists():
+                try:
+                    size = os.stat(path).st_size
+                except FileNotFoundError:
                     errors.append(f"{fname}: not found in cache")
                     continue
-                size = path.stat().st_size
                 # Unload from SPICE if loaded
-                key = str(path.resolve())
+                key = self._kernel_key(path)
                 if key in self._loaded_kernels:
                     try:
                         spice.unload(key)
                     except Exception:
                         pass
                     self._loaded_kernels.discard(key)
+                    self._loaded_snapshot = frozenset(self._loaded_kernels)
                 self._segmented_files_loaded.discard(fname)
                 try:
-                    path.unlink()
+                    os.unlink(path)
                     deleted.append(fname)
                     freed += size
                 except Exception as e:
                     errors.append(f"{fname}: {e}")
+                    continue
+                mission = file_map.get(fname)
+                if mission is not None:
+                    invalidated_missions.add(mission)
 
             # Invalidate mission-level caches if any of their files were deleted
-            file_map = self._build_file_to_mission_map()
-            invalidated_missions = {file_map.get(f) for f in deleted} - {None}
+            self._cache_size = None
             self._mission_kernels_loaded -= invalidated_missions
             if "GENERIC" in invalidated_missions:
                 self._generic_loaded = False
+                if "naif0012.tls" in deleted:
+                    self._lsk_loaded = False
 
         result: dict = {
             "deleted": deleted,
@@ -519,12 +844,10 @@ class KernelManager:
         """
         file_map = self._build_file_to_mission_map()
         # Find cached files belonging to this mission
-        to_delete = []
-        if self._kernel_dir.exists():
-            for f in self._kernel_dir.iterdir():
-                if f.is_file() and not f.name.endswith(".tmp"):
-                    if file_map.get(f.name) == mission_key:
-                        to_delete.append(f.name)
+        to_delete = [
+            e.name for e in self._scan_cache()
+            if file_map.get(e.name) == mission_key
+        ]
         if not to_delete:
             return {"deleted": [], "freed_mb": 0.0, "message": f"No cached files for {mission_key}"}
         return self.delete_cached_files(to_delete)
@@ -536,22 +859,19 @@ class KernelManager:
             Dict with deleted count and freed_mb.
         """
         self.unload_all()
-        files = []
-        if self._kernel_dir.exists():
-            files = [
-                f for f in self._kernel_dir.iterdir()
-                if f.is_file() and not f.name.endswith(".tmp")
-            ]
+        files = self._scan_cache()
         freed = 0
         deleted = 0
         errors = []
         for f in files:
             try:
-                freed += f.stat().st_size
-                f.unlink()
+                size = f.stat().st_size
+                os.unlink(f.path)
+                freed += size
                 deleted += 1
             except Exception as e:
                 errors.append(f"{f.name}: {e}")
+        self._cache_size = None
 
         result: dict = {
             "deleted_count": deleted,
@@ -562,6 +882,45 @@ class KernelManager:
         logger.info("Purged cache: %d files, %.1f MB freed", deleted, freed / (1024 * 1024))
         return result
 
+    def evict_cache(self, max_bytes: int) -> dict:
+        """Delete cached kernel files until the cache fits in max_bytes.
+
+        Victims are chosen by size-weighted LRU-K: kernels currently
+        loaded are kept longest, then files with fewer than EVICTION_K
+        recorded uses go before those with a full history, and within
+        each group the file with the largest (age of K-th most recent
+        use) x (size) goes first. Files never used by this process
+        use their modification time as the use time.
+
+        Args:
+            max_bytes: Cache size budget in bytes.
+
+        Returns:
+            Dict with deleted files and freed_mb (as delete_cached_files).
+        """
+        entries = [(e.name, e.stat()) for e in self._scan_cache()]
+        total = sum(st.st_size for _, st in entries)
+        if total <= max_bytes:
+            return {"deleted": [], "freed_mb": 0.0}
+
+        now = time.time()
+        loaded = set(self.list_loaded())
+
+        def rank(entry):
+            name, st = entry
+            history = self._use_history.get(name)
+            kth_use = history[0] if history else st.st_mtime
+            full = history is not None and len(history) == EVICTION_K
+            return (name in loaded, full, -(now - kth_use) * st.st_size)
+
+        victims = []
+        for name, st in sorted(entries, key=rank):
+            if total <= max_bytes:
+                break
+            victims.append(name)
+            total -= st.st_size
+        return self.delete_cached_files(victims)
+
 
 # ---------------------------------------------------------------------------
 # Module-level convenience functions
@@ -579,6 +938,5 @@ def check_remote_kernels(mission: str) -> dict:
     Returns:
         Dict with mission, configured_files, directories, and other_files.
     """
-    from .missions import resolve_mission
     _, mission_key = resolve_mission(mission)
     return get_kernel_manager().check_remote_kernels(mission_key)
@@ -5,12 +5,16 @@ Maps mission IDs to NAIF integer IDs, kernel source URLs,
 and provides fuzzy mission name resolution.
 """
 
+import functools
+
 # ---------------------------------------------------------------------------
 # NAIF ID mapping
 # ---------------------------------------------------------------------------
 
 # Maps mission keys (uppercase) to NAIF body/spacecraft IDs.
 # Negative IDs are spacecraft; positive are natural bodies.
+# Treat the registries in this module as read-only: the name lookup tables
+# and the supported-missions list are derived from them once at import.
 MISSION_NAIF_IDS: dict[str, int] = {
     # Heliophysics missions
     "PSP": -96,
@@ -77,68 +81,68 @@ MISSION_NAIF_IDS: dict[str, int] = {
     "SATURN_BARYCENTER": 6,
 }
 
-# Aliases: common names -> canonical mission key
+# Aliases: common names -> canonical mission key. Only synonyms that are
+# not already reachable by normalization (case and punctuation are
+# ignored) need an entry.
 _ALIASES: dict[str, str] = {
     "PARKER": "PSP",
     "PARKER SOLAR PROBE": "PSP",
     "SOLAR ORBITER": "SOLO",
-    "SOLAR_ORBITER": "SOLO",
     "SOLORB": "SOLO",
-    "STEREOA": "STEREO_A",
-    "STEREO-A": "STEREO_A",
-    "STEREOB": "STEREO_B",
-    "STEREO-B": "STEREO_B",
-    "VOYAGER1": "VOYAGER_1",
-    "VOYAGER 1": "VOYAGER_1",
     "VGR1": "VOYAGER_1",
-    "VOYAGER2": "VOYAGER_2",
-    "VOYAGER 2": "VOYAGER_2",
     "VGR2": "VOYAGER_2",
-    "PIONEER10": "PIONEER_10",
-    "PIONEER 10": "PIONEER_10",
-    "PIONEER11": "PIONEER_11",
-    "PIONEER 11": "PIONEER_11",
-    "NEWHORIZONS": "NEW_HORIZONS",
-    "NEW HORIZONS": "NEW_HORIZONS",
     "NH": "NEW_HORIZONS",
-    "HELIOS1": "HELIOS_1",
-    "HELIOS 1": "HELIOS_1",
-    "HELIOS2": "HELIOS_2",
-    "HELIOS 2": "HELIOS_2",
     "THEMIS": "THEMIS_A",
-    "ARTEMIS_P1": "THEMIS_B",
     "ARTEMIS P1": "THEMIS_B",
-    "ARTEMIS_P2": "THEMIS_C",
     "ARTEMIS P2": "THEMIS_C",
-    "EUROPA CLIPPER": "EUROPA_CLIPPER",
-    "EUROPACLIPPER": "EUROPA_CLIPPER",
     "CLIPPER": "EUROPA_CLIPPER",
     "PERSEVERANCE": "MARS_2020",
-    "MARS2020": "MARS_2020",
-    "MARS 2020": "MARS_2020",
     "BEPI": "BEPICOLOMBO",
-    "BEPI COLOMBO": "BEPICOLOMBO",
-    "BEPI_COLOMBO": "BEPICOLOMBO",
     "MPO": "BEPICOLOMBO",
     "VAN ALLEN PROBE A": "RBSP_A",
-    "VAN_ALLEN_PROBE_A": "RBSP_A",
-    "RBSPA": "RBSP_A",
     "VAN ALLEN PROBE B": "RBSP_B",
-    "VAN_ALLEN_PROBE_B": "RBSP_B",
-    "RBSPB": "RBSP_B",
     "VENUS EXPRESS": "VEX",
-    "VENUS_EXPRESS": "VEX",
     "PVO": "PIONEER_VENUS",
     "PIONEER 12": "PIONEER_VENUS",
-    "PIONEER_12": "PIONEER_VENUS",
     "PIONEER VENUS ORBITER": "PIONEER_VENUS",
     "NSYT": "INSIGHT",
-    "LUNAR PROSPECTOR": "LUNAR_PROSPECTOR",
     "LP": "LUNAR_PROSPECTOR",
     "MARS GLOBAL SURVEYOR": "MGS",
-    "MARS_GLOBAL_SURVEYOR": "MGS",
 }
 
+
+# Uppercases ASCII letters and deletes every other ASCII non-alphanumeric
+# ("-", " ", "_", ".", "/", ...) in a single C-level pass
+_NORM_TABLE = str.maketrans(
+    "abcdefghijklmnopqrstuvwxyz",
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "".join(chr(c) for c in range(128) if not chr(c).isalnum()),
+)
+
+
+def _normalize(name: str) -> str:
+    """Normalize a mission name for lookup: uppercase alphanumerics only."""
+    return name.translate(_NORM_TABLE)
+
+
+def _build_resolve_table() -> dict[str, tuple[int, str]]:
+    """Flatten canonical keys and aliases into one normalized lookup.
+
+    Keys are normalized with _normalize, so "STEREO_A", "stereo-a" and
+    "Stereo A" share one entry. Canonical keys win over aliases.
+    """
+    table: dict[str, tuple[int, str]] = {
+        _normalize(key): (naif_id, key) for key, naif_id in MISSION_NAIF_IDS.items()
+    }
+    for alias, canon in _ALIASES.items():
+        if canon in MISSION_NAIF_IDS:
+            table.setdefault(_normalize(alias), (MISSION_NAIF_IDS[canon], canon))
+    return table
+
+
+# Normalized name -> (NAIF ID, canonical key)
+_RESOLVE: dict[str, tuple[int, str]] = _build_resolve_table()
+
 # ---------------------------------------------------------------------------
 # Kernel sources — URLs to NAIF/ESA kernel repositories
 # ---------------------------------------------------------------------------
@@ -394,10 +398,13 @@ def has_kernels(mission_key: str) -> bool:
     """Check if a mission has kernel support (single-file or segmented)."""
     return mission_key in MISSION_KERNELS or mission_key in SEGMENTED_MISSIONS
 
+@functools.lru_cache(maxsize=256)
 def resolve_mission(name: str) -> tuple[int, str]:
     """Resolve a mission name to (NAIF ID, canonical mission key).
 
-    Performs case-insensitive lookup with alias support.
+    Performs case-insensitive lookup with alias support. Results are
+    memoized on the raw input string (so "PSP" and " psp " are separate
+    cache entries); unknown names raise every time and are not cached.
 
     Args:
         name: Mission name (e.g., "PSP", "Parker Solar Probe", "ace").
@@ -408,41 +415,38 @@ def resolve_mission(name: str) -> tuple[int, str]:
     Raises:
         KeyError: If the mission name cannot be resolved.
     """
-    key = name.strip().upper().replace("-", "_")
-
-    # Direct match
-    if key in MISSION_NAIF_IDS:
-        return MISSION_NAIF_IDS[key], key
+    # Already-canonical input (typical for programmatic callers)
+    naif_id = MISSION_NAIF_IDS.get(name)
+    if naif_id is not None:
+        return naif_id, name
 
-    # Alias match
-    alias_key = _ALIASES.get(key) or _ALIASES.get(name.strip().upper())
-    if alias_key and alias_key in MISSION_NAIF_IDS:
-        return MISSION_NAIF_IDS[alias_key], alias_key
+    key = _normalize(name)
+    hit = _RESOLVE.get(key)
+    if hit is not None:
+        return hit
 
-    # Try without underscores
-    compact = key.replace("_", "")
-    for canon, naif_id in MISSION_NAIF_IDS.items():
-        if canon.replace("_", "") == compact:
-            return naif_id, canon
-
-    raise KeyError(
-        f"Unknown mission '{name}'. Supported: "
-        + ", ".join(sorted(k for k, v in MISSION_NAIF_IDS.items() if v < 0))
-    )
+    raise KeyError(f"Unknown mission '{name}'. Supported: {_SUPPORTED_STR}")
 
 
 def list_supported_missions() -> list[dict]:
     """Return a list of supported missions with NAIF IDs and kernel availability.
 
     Returns:
-        List of dicts with keys: mission_key, naif_id, has_kernels.
+        List of dicts with keys: mission_key, naif_id, has_kernels, segmented.
     """
-    return [
-        {
-            "mission_key": key,
-            "naif_id": naif_id,
-            "has_kernels": has_kernels(key),
-        }
-        for key, naif_id in sorted(MISSION_NAIF_IDS.items())
-        if naif_id < 0  # spacecraft only
-    ]
+    # Fresh dicts: callers (e.g. the MCP server) annotate entries in place
+    return [dict(m) for m in _SUPPORTED_MISSIONS]
+
+
+# Spacecraft entries (negative NAIF IDs), built once at import time
+_SUPPORTED_MISSIONS: tuple[dict, ...] = tuple(
+    {
+        "mission_key": key,
+        "naif_id": naif_id,
+        "has_kernels": has_kernels(key),
+        "segmented": key in SEGMENTED_MISSIONS,
+    }
+    for key, naif_id in sorted(MISSION_NAIF_IDS.items())
+    if naif_id < 0  # spacecraft only
+)
+_SUPPORTED_STR = ", ".join(m["mission_key"] for m in _SUPPORTED_MISSIONS)
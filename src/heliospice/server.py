@@ -15,6 +15,7 @@ Usage:
 
 import argparse
 import logging
+import math
 import sys
 
 try:
@@ -31,6 +32,72 @@ except ImportError:
 _MAX_RESPONSE_POINTS = 10_000
 
 
+def _too_many_points_message(n_points: int) -> str:
+    """Error message for a timeseries over the response point limit."""
+    return (
+        f"Response contains {n_points:,} data points, exceeding the "
+        f"{_MAX_RESPONSE_POINTS:,} point limit. Either increase the step "
+        f"size, narrow the time range, or set allow_large_response=True."
+    )
+
+
+def _estimate_points(time_start: str, time_end: str, step: str) -> int | None:
+    """Estimate a timeseries point count without touching SPICE.
+
+    Uses the UTC span, which is never longer than the ET span that
+    get_trajectory samples (they differ only by leap seconds), and applies
+    get_trajectory's point cap, so the estimate never exceeds the real count.
+
+    Returns:
+        Estimated point count, or None if the times are not ISO 8601
+        strings this helper can parse (get_trajectory then decides).
+
+    Raises:
+        ValueError: If step is invalid.
+    """
+    from datetime import datetime
+    from .ephemeris import _MAX_TRAJECTORY_STEPS, _parse_step
+
+    step_s = _parse_step(step)
+    try:
+        span = datetime.fromisoformat(time_end.strip()) - datetime.fromisoformat(time_start.strip())
+    except (ValueError, TypeError):
+        return None
+    n_points = max(1, int(span.total_seconds() / step_s) + 1)
+    return min(n_points, _MAX_TRAJECTORY_STEPS + 1)
+
+
+def _preview_decimals(column: str) -> int:
+    """Decimal places shown for a trajectory column in preview rows."""
+    return 6 if "au" in column else 3 if "km_s" in column else 1
+
+
+def _frame_records(df) -> list[dict]:
+    """Convert a time-indexed DataFrame to JSON-ready row dicts.
+
+    Formats the index and converts all cells to Python floats in bulk
+    rather than materializing a Series per row.
+    """
+    columns = list(df.columns)
+    times = df.index.astype(str).tolist()
+    return [
+        {"time": t, **dict(zip(columns, row))}
+        for t, row in zip(times, df.to_numpy(dtype=float).tolist())
+    ]
+
+
+def _frame_columns(df) -> dict[str, list]:
+    """Convert a time-indexed DataFrame to a JSON-ready dict of columns.
+
+    Column names appear once rather than once per row, so the payload
+    is smaller and each column can be loaded straight into an array.
+    """
+    data: dict[str, list] = {"time": df.index.astype(str).tolist()}
+    for col, values in zip(df.columns, df.to_numpy(dtype=float).T.tolist()):
+        data[col] = values
+    return data
+
+
 def _create_server() -> "FastMCP":
     """Create and configure the MCP server with all tools."""
     if FastMCP is None:
@@ -72,6 +139,7 @@ def _create_server() -> "FastMCP":
         step: str = "1h",
         include_velocity: bool = False,
         allow_large_response: bool = False,
+        columnar: bool = False,
     ) -> dict:
         """Get spacecraft position and/or velocity — single time or timeseries.
 
@@ -91,7 +159,8 @@ def _create_server() -> "FastMCP":
             time_end: End time for timeseries (ISO 8601). Leave empty for single-time query.
             step: Time step for timeseries (e.g., "1m", "1h", "6h", "1d"). Only used when time_end is provided.
             include_velocity: If True, include velocity components (vx, vy, vz in km/s) and speed.
-            allow_large_response: Set True to return more than 10,000 data points. Default False — large responses are rejected with summary stats and a hint to increase the step size or narrow the time range. Only used for timeseries.
+            allow_large_response: Set True to return more than 10,000 data points. Default False — requests estimated at over 10,000 points are rejected before any computation, returning the requested range, the estimated n_points and a hint to increase the step size or narrow the time range (no summary stats or preview). Only used for timeseries.
+            columnar: If True, return timeseries data as columns ({"time": [...], "x_km": [...], ...}) instead of one record per row. Smaller for long timeseries. Only used for timeseries.
 
         Examples:
             - get_spacecraft_ephemeris("PSP", "2024-01-15", "ECLIPJ2000", "SUN")
@@ -118,6 +187,22 @@ def _create_server() -> "FastMCP":
             from .ephemeris import get_trajectory
             import numpy as np
 
+            # Reject clearly oversized requests before computing any points
+            if not allow_large_response:
+                n_est = _estimate_points(time, time_end, step)
+                if n_est is not None and n_est > _MAX_RESPONSE_POINTS:
+                    return {
+                        "status": "error",
+                        "cache_size_mb": _cache_size_mb(),
+                        "spacecraft": spacecraft,
+                        "observer": observer,
+                        "frame": frame,
+                        "time_start": time,
+                        "time_end": time_end,
+                        "n_points": n_est,
+                        "message": _too_many_points_message(n_est),
+                    }
+
             df = get_trajectory(
                 target=spacecraft,
                 observer=observer,
@@ -128,7 +213,9 @@ def _create_server() -> "FastMCP":
                 include_velocity=include_velocity,
             )
 
-            # Summary stats
+            # Summary stats (both distance columns reduced as one (N, 2) array)
+            dist = df[["r_au", "r_km"]].to_numpy()
+            lo, hi = dist.min(axis=0), dist.max(axis=0)
             summary = {
                 "status": "success",
                 "cache_size_mb": _cache_size_mb(),
@@ -140,21 +227,20 @@ def _create_server() -> "FastMCP":
                 "n_points": len(df),
                 "columns": list(df.columns),
                 "distance_au": {
-                    "min": round(float(df["r_au"].min()), 6),
-                    "max": round(float(df["r_au"].max()), 6),
-                    "mean": round(float(df["r_au"].mean()), 6),
+                    "min": round(float(lo[0]), 6),
+                    "max": round(float(hi[0]), 6),
+                    "mean": round(float(dist[:, 0].mean()), 6),
                 },
                 "distance_km": {
-                    "min": round(float(df["r_km"].min()), 1),
-                    "max": round(float(df["r_km"].max()), 1),
+                    "min": round(float(lo[1]), 1),
+                    "max": round(float(hi[1]), 1),
                 },
             }
 
             # Add speed stats when velocity is included
             if include_velocity:
-                speed = np.sqrt(
-                    df["vx_km_s"]**2 + df["vy_km_s"]**2 + df["vz_km_s"]**2
-                )
+                vel = df[["vx_km_s", "vy_km_s", "vz_km_s"]].to_numpy()
+                speed = np.sqrt(np.einsum("ij,ij->i", vel, vel))
                 df["speed_km_s"] = speed
                 summary["columns"] = list(df.columns)
                 summary["speed_km_s"] = {
@@ -165,33 +251,20 @@ def _create_server() -> "FastMCP":
 
             # Preview: first/last few data points
             n_preview = min(5, len(df))
-            preview_rows = []
-            for idx in list(range(n_preview)) + list(range(max(n_preview, len(df) - n_preview), len(df))):
-                row = df.iloc[idx]
-                entry = {"time": str(df.index[idx])}
-                for col in df.columns:
-                    entry[col] = round(float(row[col]), 6 if "au" in col else 3 if "km_s" in col else 1)
-                preview_rows.append(entry)
-            summary["preview"] = preview_rows
+            preview_idx = list(range(n_preview)) + list(range(max(n_preview, len(df) - n_preview), len(df)))
+            preview = df.iloc[preview_idx]
+            summary["preview"] = _frame_records(
+                preview.round({col: _preview_decimals(col) for col in preview.columns})
+            )
 
             # Guard: reject large responses unless caller opted in
             if len(df) > _MAX_RESPONSE_POINTS and not allow_large_response:
                 summary["status"] = "error"
-                summary["message"] = (
-                    f"Response contains {len(df):,} data points, exceeding the "
-                    f"{_MAX_RESPONSE_POINTS:,} point limit. Either increase the step "
-                    f"size, narrow the time range, or set allow_large_response=True."
-                )
+                summary["message"] = _too_many_points_message(len(df))
                 return summary
 
             # Full data for downstream storage/plotting
-            records = []
-            for ts, row in df.iterrows():
-                record = {"time": str(ts)}
-                for col in df.columns:
-                    record[col] = float(row[col])
-                records.append(record)
-            summary["data"] = records
+            summary["data"] = _frame_columns(df) if columnar else _frame_records(df)
 
             return summary
 
@@ -232,6 +305,10 @@ def _create_server() -> "FastMCP":
                 frame="ECLIPJ2000",
             )
 
+            # Both distance columns reduced together as one (N, 2) array
+            dist = df[["r_km", "r_au"]].to_numpy()
+            lo, hi, mean = dist.min(axis=0), dist.max(axis=0), dist.mean(axis=0)
+
             result = {
                 "status": "success",
                 "cache_size_mb": _cache_size_mb(),
@@ -241,23 +318,23 @@ def _create_server() -> "FastMCP":
                 "time_end": str(df.index[-1]),
                 "n_points": len(df),
                 "distance_au": {
-                    "min": round(float(df["r_au"].min()), 6),
-                    "max": round(float(df["r_au"].max()), 6),
-                    "mean": round(float(df["r_au"].mean()), 6),
+                    "min": round(float(lo[1]), 6),
+                    "max": round(float(hi[1]), 6),
+                    "mean": round(float(mean[1]), 6),
                 },
                 "distance_km": {
-                    "min": round(float(df["r_km"].min()), 1),
-                    "max": round(float(df["r_km"].max()), 1),
-                    "mean": round(float(df["r_km"].mean()), 1),
+                    "min": round(float(lo[0]), 1),
+                    "max": round(float(hi[0]), 1),
+                    "mean": round(float(mean[0]), 1),
                 },
             }
 
             # Find closest approach
-            min_idx = df["r_km"].idxmin()
+            i = int(dist[:, 0].argmin())
             result["closest_approach"] = {
-                "time": str(min_idx),
-                "distance_km": round(float(df.loc[min_idx, "r_km"]), 1),
-                "distance_au": round(float(df.loc[min_idx, "r_au"]), 6),
+                "time": str(df.index[i]),
+                "distance_km": round(float(dist[i, 0]), 1),
+                "distance_au": round(float(dist[i, 1]), 6),
             }
 
             return result
@@ -267,16 +344,16 @@ def _create_server() -> "FastMCP":
 
     @mcp.tool()
     def transform_coordinates(
-        vector: list[float],
+        vector: list[float] | list[list[float]],
         time: str,
         from_frame: str,
         to_frame: str,
         spacecraft: str = "",
     ) -> dict:
-        """Transform a 3D vector between coordinate frames.
+        """Transform a 3D vector (or a batch of vectors) between coordinate frames.
 
         Args:
-            vector: 3-element vector [x, y, z] to transform
+            vector: 3-element vector [x, y, z] to transform, or a list of such vectors. A batch shares one rotation computed at `time`, and output_vector/magnitude are returned as lists.
             time: UTC time (ISO 8601) for the transformation epoch
             from_frame: Source frame (e.g., "J2000", "ECLIPJ2000", "RTN")
             to_frame: Target frame (e.g., "ECLIPJ2000", "J2000", "RTN")
@@ -285,26 +362,42 @@ def _create_server() -> "FastMCP":
         Examples:
             - transform_coordinates([1.0, 0.0, 0.0], "2024-01-15", "J2000", "ECLIPJ2000")
             - transform_coordinates([5.0, -3.0, 1.0], "2024-01-15", "RTN", "J2000", spacecraft="PSP")
+            - transform_coordinates([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], "2024-01-15", "J2000", "ECLIPJ2000")
         """
-        from .frames import transform_vector
+        from .frames import transform_vector, transform_vector_batch
         try:
-            import numpy as np
-            result_vec = transform_vector(
-                vector=vector,
-                time=time,
-                from_frame=from_frame,
-                to_frame=to_frame,
-                spacecraft=spacecraft,
-            )
+            if vector and isinstance(vector[0], (list, tuple)):
+                import numpy as np
+                # Batch: one rotation matrix applied to every vector
+                out = transform_vector_batch(
+                    vectors=vector,
+                    times=time,
+                    from_frame=from_frame,
+                    to_frame=to_frame,
+                    spacecraft=spacecraft,
+                )
+                output_vector = np.round(out, 6).tolist()
+                magnitude = np.round(np.sqrt(np.einsum("ij,ij->i", out, out)), 6).tolist()
+            else:
+                result_vec = transform_vector(
+                    vector=vector,
+                    time=time,
+                    from_frame=from_frame,
+                    to_frame=to_frame,
+                    spacecraft=spacecraft,
+                )
+                x, y, z = result_vec.tolist()
+                output_vector = [round(x, 6), round(y, 6), round(z, 6)]
+                magnitude = round(math.hypot(x, y, z), 6)
             return {
                 "status": "success",
                 "cache_size_mb": _cache_size_mb(),
                 "input_vector": vector,
-                "output_vector": [round(float(v), 6) for v in result_vec],
+                "output_vector": output_vector,
                 "from_frame": from_frame,
                 "to_frame": to_frame,
                 "time": time,
-                "magnitude": round(float(np.linalg.norm(result_vec)), 6),
+                "magnitude": magnitude,
             }
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -316,7 +409,7 @@ def _create_server() -> "FastMCP":
         Returns the full list of missions that can be queried for positions
         and trajectories.
         """
-        from .missions import list_supported_missions, MISSION_KERNELS, SEGMENTED_MISSIONS
+        from .missions import list_supported_missions, MISSION_KERNELS
         from .kernel_manager import get_kernel_manager
 
         missions = list_supported_missions()
@@ -326,8 +419,7 @@ def _create_server() -> "FastMCP":
         for m in missions:
             key = m["mission_key"]
             kernel_files = MISSION_KERNELS.get(key, {})
-            m["kernels_loaded"] = all(f in loaded for f in kernel_files) if kernel_files else False
-            m["segmented"] = key in SEGMENTED_MISSIONS
+            m["kernels_loaded"] = bool(kernel_files) and loaded.issuperset(kernel_files)
 
         return {
             "status": "success",
@@ -0,0 +1,23 @@
+"""Shared fixtures for the heliospice test suite."""
+
+import numpy as np
+import pytest
+
+
+# DELTET constants from naif0012.tls as returned by spice.gdpool
+# (leap second table truncated to the 1999 and 2017 entries)
+_LSK_POOL = {
+    "DELTET/DELTA_T_A": [32.184],
+    "DELTET/K": [1.657e-3],
+    "DELTET/EB": [1.671e-2],
+    "DELTET/M": [6.239996, 1.99096871e-7],
+    "DELTET/DELTA_AT": [32.0, -31579200.0, 37.0, 536500800.0],
+}
+
+
+@pytest.fixture
+def fake_gdpool():
+    """Stand-in for spice.gdpool serving the DELTET leap-second constants."""
+    def gdpool(name, start, room):
+        return np.array(_LSK_POOL[name])
+    return gdpool
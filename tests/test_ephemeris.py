@@ -37,6 +37,26 @@ class TestEphemeris:
         assert result["target"] == "EARTH"
         assert result["observer"] == "SUN"
 
+    @patch("heliospice.ephemeris.get_kernel_manager")
+    @patch("heliospice.ephemeris.spice")
+    def test_get_position_numeric_et(self, mock_spice, mock_get_km):
+        """Numeric time is used as ET directly, without utc2et."""
+        from heliospice.ephemeris import get_position
+
+        mock_km = MagicMock()
+        mock_km.lock = MagicMock()
+        mock_km.lock.__enter__ = MagicMock(return_value=None)
+        mock_km.lock.__exit__ = MagicMock(return_value=False)
+        mock_get_km.return_value = mock_km
+
+        mock_spice.et2utc.return_value = "2000-01-02T12:00:00"
+        mock_spice.spkpos.return_value = ([1.496e8, 0.0, 0.0], 499.0)
+
+        get_position("EARTH", "SUN", 86400.0)
+
+        mock_spice.utc2et.assert_not_called()
+        assert mock_spice.spkpos.call_args[0][1] == 86400.0
+
     @patch("heliospice.ephemeris.get_kernel_manager")
     @patch("heliospice.ephemeris.spice")
     def test_get_state(self, mock_spice, mock_get_km):
@@ -63,7 +83,7 @@ class TestEphemeris:
 
     @patch("heliospice.ephemeris.get_kernel_manager")
     @patch("heliospice.ephemeris.spice")
-    def test_get_trajectory(self, mock_spice, mock_get_km):
+    def test_get_trajectory(self, mock_spice, mock_get_km, fake_gdpool):
         """get_trajectory returns a DataFrame with expected columns."""
         from heliospice.ephemeris import get_trajectory
 
@@ -74,9 +94,9 @@ class TestEphemeris:
         mock_get_km.return_value = mock_km
 
         mock_spice.utc2et.return_value = 0.0
-        # Return different positions for a trajectory
-        mock_spice.spkpos.return_value = ([1.496e8, 0.0, 0.0], 499.0)
-        mock_spice.et2utc.return_value = "2024-01-01T00:00:00.000"
+        # Batched spkpos over the ET array
+        mock_spice.spkpos.return_value = (np.array([[1.496e8, 0.0, 0.0]]), np.array([499.0]))
+        mock_spice.gdpool.side_effect = fake_gdpool
 
         df = get_trajectory("EARTH", "SUN", "2024-01-01", "2024-01-01", step="1d")
 
@@ -90,7 +110,7 @@ class TestEphemeris:
 
     @patch("heliospice.ephemeris.get_kernel_manager")
     @patch("heliospice.ephemeris.spice")
-    def test_get_trajectory_with_velocity(self, mock_spice, mock_get_km):
+    def test_get_trajectory_with_velocity(self, mock_spice, mock_get_km, fake_gdpool):
         """get_trajectory with include_velocity adds velocity columns."""
         from heliospice.ephemeris import get_trajectory
 
@@ -102,9 +122,9 @@ class TestEphemeris:
 
         mock_spice.utc2et.return_value = 0.0
         mock_spice.spkezr.return_value = (
-            [1.496e8, 0.0, 0.0, 0.0, 29.78, 0.0], 499.0
+            np.array([[1.496e8, 0.0, 0.0, 0.0, 29.78, 0.0]]), np.array([499.0])
         )
-        mock_spice.et2utc.return_value = "2024-01-01T00:00:00.000"
+        mock_spice.gdpool.side_effect = fake_gdpool
 
         df = get_trajectory(
             "EARTH", "SUN", "2024-01-01", "2024-01-01",
@@ -114,6 +134,49 @@ class TestEphemeris:
         assert "vx_km_s" in df.columns
         assert "vy_km_s" in df.columns
         assert "vz_km_s" in df.columns
+        assert df["vy_km_s"].iloc[0] == pytest.approx(29.78, rel=1e-6)
+
+    @patch("heliospice.ephemeris.get_kernel_manager")
+    @patch("heliospice.ephemeris.spice")
+    def test_get_trajectory_batched_spice_call(self, mock_spice, mock_get_km, fake_gdpool):
+        """get_trajectory issues one spkpos call over the whole ET array."""
+        from heliospice.ephemeris import get_trajectory
+
+        mock_km = MagicMock()
+        mock_km.lock = MagicMock()
+        mock_km.lock.__enter__ = MagicMock(return_value=None)
+        mock_km.lock.__exit__ = MagicMock(return_value=False)
+        mock_get_km.return_value = mock_km
+
+        et0 = 757339269.1839061  # 2024-01-01T00:00:00 UTC
+        mock_spice.utc2et.side_effect = lambda t: et0 if t == "2024-01-01" else et0 + 86400.0
+        mock_spice.spkpos.side_effect = lambda targ, et, *a: (
+            np.column_stack([np.full(len(et), 1.496e8), et - et0, np.zeros(len(et))]),
+            np.full(len(et), 499.0),
+        )
+        mock_spice.gdpool.side_effect = fake_gdpool
+
+        df = get_trajectory("EARTH", "SUN", "2024-01-01", "2024-01-02", step="1h")
+
+        assert mock_spice.spkpos.call_count == 1
+        mock_spice.et2utc.assert_not_called()
+        assert len(df) == 25
+        assert df.index[0] == pd.Timestamp("2024-01-01T00:00:00")
+        assert df.index[-1] == pd.Timestamp("2024-01-02T00:00:00")
+        assert df["y_km"].iloc[-1] == pytest.approx(86400.0)
+
+    @patch("heliospice.ephemeris.spice")
+    def test_et_to_utc_index_leap_second(self, mock_spice, fake_gdpool):
+        """ET -> UTC conversion applies the leap second table."""
+        from heliospice.ephemeris import _et_to_utc_index
+
+        mock_spice.gdpool.side_effect = fake_gdpool
+        # Half a second before the 2017 leap second (TAI-UTC=32 in the
+        # truncated table) and 2024-01-01T00:00:00 (TAI-UTC=37)
+        index = _et_to_utc_index(np.array([536500863.6839298, 757339269.1839061]))
+
+        assert index[0] == pd.Timestamp("2016-12-31T23:59:59.500")
+        assert index[1] == pd.Timestamp("2024-01-01T00:00:00")
 
     def test_parse_step(self):
         """_parse_step correctly parses time step strings."""
@@ -123,3 +186,26 @@ class TestEphemeris:
         assert _parse_step("1d") == 86400
         assert _parse_step("60s") == 60
         assert _parse_step("3600") == 3600
+        assert _parse_step(" 1.5H ") == 5400
+
+    def test_parse_step_invalid(self):
+        """_parse_step rejects unparseable step strings."""
+        from heliospice.ephemeris import _parse_step
+        with pytest.raises(ValueError, match="Invalid step"):
+            _parse_step("1w")
+
+    @patch("heliospice.ephemeris._ensure_kernels")
+    def test_trajectory_invalid_step_skips_kernels(self, mock_ensure):
+        """An invalid step fails before any kernel is downloaded."""
+        from heliospice.ephemeris import get_trajectory
+        with pytest.raises(ValueError, match="Invalid step"):
+            get_trajectory("PSP", "SUN", "2024-01-01", "2024-01-02", step="1w")
+        mock_ensure.assert_not_called()
+
+    def test_import_does_not_load_pandas(self):
+        """Importing heliospice defers pandas until get_trajectory."""
+        import subprocess
+        import sys
+        code = "import sys, heliospice; print('pandas' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
@@ -56,6 +56,104 @@ class TestFrames:
 
         mock_spice.pxform.assert_called_once()
         np.testing.assert_array_almost_equal(result, v)
+        mock_km.ensure_lsk.assert_called_once()
+        mock_km.ensure_generic_kernels.assert_not_called()
+
+    @patch("heliospice.frames.get_kernel_manager")
+    @patch("heliospice.frames.spice")
+    def test_transform_body_fixed_loads_generic_kernels(self, mock_spice, mock_get_km):
+        """Non-inertial frames (PCK or FK defined) load the generic kernels."""
+        from heliospice.frames import transform_vector
+
+        mock_km = MagicMock()
+        mock_km.lock = MagicMock()
+        mock_km.lock.__enter__ = MagicMock(return_value=None)
+        mock_km.lock.__exit__ = MagicMock(return_value=False)
+        mock_get_km.return_value = mock_km
+
+        mock_spice.utc2et.return_value = 0.0
+        mock_spice.pxform.return_value = np.eye(3)
+
+        for frame in ("IAU_SUN", "HEE"):
+            mock_km.reset_mock()
+            transform_vector(np.array([1.0, 0.0, 0.0]), "2024-01-01", "J2000", frame)
+            mock_km.ensure_generic_kernels.assert_called_once()
+
+    @patch("heliospice.frames.get_kernel_manager")
+    @patch("heliospice.frames.spice")
+    def test_transform_batch_single_time(self, mock_spice, mock_get_km):
+        """A single time computes one matrix and applies it to all vectors."""
+        from heliospice.frames import transform_vector_batch
+
+        mock_km = MagicMock()
+        mock_km.lock = MagicMock()
+        mock_km.lock.__enter__ = MagicMock(return_value=None)
+        mock_km.lock.__exit__ = MagicMock(return_value=False)
+        mock_get_km.return_value = mock_km
+
+        mock_spice.utc2et.return_value = 0.0
+        # 90 degree rotation about Z
+        mock_spice.pxform.return_value = np.array([
+            [0.0, -1.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0],
+        ])
+
+        vectors = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 2.0]])
+        result = transform_vector_batch(vectors, "2024-01-01", "J2000", "ECLIPJ2000")
+
+        mock_spice.pxform.assert_called_once()
+        np.testing.assert_array_almost_equal(
+            result, [[0.0, 1.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 0.0, 2.0]]
+        )
+
+    @patch("heliospice.frames.get_kernel_manager")
+    @patch("heliospice.frames.spice")
+    def test_transform_numeric_et(self, mock_spice, mock_get_km):
+        """Numeric times are used as ET directly, without utc2et."""
+        from heliospice.frames import transform_vector_batch
+
+        mock_km = MagicMock()
+        mock_km.lock = MagicMock()
+        mock_km.lock.__enter__ = MagicMock(return_value=None)
+        mock_km.lock.__exit__ = MagicMock(return_value=False)
+        mock_get_km.return_value = mock_km
+        mock_spice.pxform.return_value = np.eye(3)
+
+        transform_vector_batch(np.eye(3), [0.0, 60.0, 120.0], "J2000", "ECLIPJ2000")
+
+        mock_spice.utc2et.assert_not_called()
+        assert [c[0][2] for c in mock_spice.pxform.call_args_list] == [0.0, 60.0, 120.0]
+
+    @patch("heliospice.frames.get_kernel_manager")
+    @patch("heliospice.frames.spice")
+    def test_transform_batch_per_time(self, mock_spice, mock_get_km):
+        """One time per vector uses a matrix per time."""
+        from heliospice.frames import transform_vector_batch
+
+        mock_km = MagicMock()
+        mock_km.lock = MagicMock()
+        mock_km.lock.__enter__ = MagicMock(return_value=None)
+        mock_km.lock.__exit__ = MagicMock(return_value=False)
+        mock_get_km.return_value = mock_km
+
+        mock_spice.utc2et.side_effect = lambda t: float(t[-1])
+        mock_spice.pxform.side_effect = lambda src, dst, et: np.eye(3) * (et + 1.0)
+
+        vectors = np.ones((3, 3))
+        result = transform_vector_batch(
+            vectors, ["2024-01-01T00:00:00", "2024-01-01T00:00:01", "2024-01-01T00:00:02"],
+            "J2000", "ECLIPJ2000",
+        )
+
+        assert mock_spice.pxform.call_count == 3
+        np.testing.assert_array_almost_equal(result[:, 0], [1.0, 2.0, 3.0])
+
+    def test_transform_batch_length_mismatch(self):
+        """Times must match the number of vectors."""
+        from heliospice.frames import transform_vector_batch
+        with pytest.raises(ValueError, match="2 times for 3 vectors"):
+            transform_vector_batch(np.ones((3, 3)), ["2024-01-01", "2024-01-02"], "J2000", "ECLIPJ2000")
 
     def test_transform_bad_vector_shape(self):
         """Non-3D vectors raise ValueError."""
@@ -80,6 +178,45 @@ class TestFrames:
         with pytest.raises(ValueError, match="spacecraft.*required"):
             transform_vector([1.0, 0.0, 0.0], "2024-01-01", "J2000", "RTN")
 
+    @patch("heliospice.frames.get_kernel_manager")
+    @patch("heliospice.frames.spice")
+    def test_compute_rtn_matrices_batch(self, mock_spice, mock_get_km):
+        """Batched RTN matrices are orthonormal and match the single-time path."""
+        from heliospice.frames import _compute_rtn_matrices, _compute_rtn_matrix
+
+        mock_km = MagicMock()
+        mock_km.lock = MagicMock()
+        mock_km.lock.__enter__ = MagicMock(return_value=None)
+        mock_km.lock.__exit__ = MagicMock(return_value=False)
+        mock_get_km.return_value = mock_km
+
+        positions = np.array([
+            [1.0e8, 0.0, 0.0],
+            [0.0, 2.0e8, 1.0e7],
+            [-5.0e7, 3.0e7, -2.0e7],
+        ])
+        mock_spice.spkpos.side_effect = lambda targ, et, *a: (
+            positions[np.asarray(et, dtype=int)], np.zeros(len(et))
+        )
+
+        mats = _compute_rtn_matrices("PSP", np.array([0.0, 1.0, 2.0]))
+
+        assert mats.shape == (3, 3, 3)
+        for i, mat in enumerate(mats):
+            np.testing.assert_allclose(mat @ mat.T, np.eye(3), atol=1e-12)
+            np.testing.assert_allclose(mat[0], positions[i] / np.linalg.norm(positions[i]))
+            np.testing.assert_allclose(_compute_rtn_matrix("PSP", float(i)), mat)
+
+    def test_rtn_basis_degenerate_pole(self):
+        """A position along the solar rotation axis falls back to T = +Y."""
+        from heliospice.frames import _rtn_basis, _SUN_NORTH_J2000
+
+        mats = _rtn_basis(np.array([_SUN_NORTH_J2000 * 1.0e8, [1.0e8, 0.0, 0.0]]))
+
+        np.testing.assert_allclose(mats[0, 1], [0.0, 1.0, 0.0])
+        assert np.all(np.isfinite(mats))
+        np.testing.assert_allclose(mats[1] @ mats[1].T, np.eye(3), atol=1e-12)
+
     def test_list_frames_with_descriptions(self):
         """list_frames_with_descriptions returns structured data."""
         from heliospice.frames import list_frames_with_descriptions
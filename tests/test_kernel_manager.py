@@ -1,9 +1,17 @@
 """Tests for heliospice.kernel_manager — kernel download, cache, and loading."""
 
-from unittest.mock import patch
+import os
+from unittest.mock import MagicMock, patch
 import pytest
 
 
+def _sparse_file(path, size):
+    """Create a file of ``size`` bytes without writing any data blocks."""
+    with open(path, "wb") as f:
+        os.ftruncate(f.fileno(), size)
+    return path
+
+
 class TestKernelManager:
     @patch("heliospice.kernel_manager.spice")
     def test_load_kernel_idempotent(self, mock_spice, tmp_path):
@@ -19,6 +27,39 @@ class TestKernelManager:
         # furnsh should only be called once
         assert mock_spice.furnsh.call_count == 1
 
+    @patch("heliospice.kernel_manager.spice")
+    def test_load_kernel_resolves_path_once(self, mock_spice, tmp_path):
+        from pathlib import Path
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        fake_path = tmp_path / "test.tls"
+        fake_path.write_text("fake kernel")
+
+        with patch.object(Path, "resolve", autospec=True, side_effect=lambda p: p) as mock_resolve:
+            km.load_kernel(fake_path)
+            km.load_kernel(tmp_path / "test.tls")
+
+        assert mock_resolve.call_count == 1
+        assert mock_spice.furnsh.call_count == 1
+
+    @patch("heliospice.kernel_manager.spice")
+    def test_load_kernel_loaded_skips_lock(self, mock_spice, tmp_path):
+        """Reloading an already-loaded kernel does not take the pool lock."""
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        fake_path = tmp_path / "test.tls"
+        fake_path.write_text("fake kernel")
+        km.load_kernel(fake_path)
+
+        km._lock = MagicMock()
+        km.load_kernel(fake_path)
+        km._lock.__enter__.assert_not_called()
+
+        km.unload_all()
+        assert km._loaded_snapshot == frozenset()
+
     @patch("heliospice.kernel_manager.spice")
     def test_unload_all(self, mock_spice, tmp_path):
         from heliospice.kernel_manager import KernelManager
@@ -60,13 +101,29 @@ class TestKernelManager:
 
         assert km.get_cache_size_bytes() == 1024
 
+    @patch("heliospice.kernel_manager.spice")
+    def test_cache_size_reused_until_delete(self, mock_spice, tmp_path):
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        (tmp_path / "a.bsp").write_bytes(b"x" * 1024)
+        assert km.get_cache_size_bytes() == 1024
+
+        # Files written behind the manager's back are not rescanned within the TTL
+        (tmp_path / "b.bsp").write_bytes(b"x" * 512)
+        assert km.get_cache_size_bytes() == 1024
+
+        # Deleting through the manager resets the cached size
+        km.delete_cached_files(["a.bsp"])
+        assert km.get_cache_size_bytes() == 512
+
     @patch("heliospice.kernel_manager.spice")
     def test_cache_info(self, mock_spice, tmp_path):
         from heliospice.kernel_manager import KernelManager
         km = KernelManager(kernel_dir=tmp_path)
 
         f1 = tmp_path / "test.bsp"
-        f1.write_bytes(b"x" * (1024 * 1024))  # 1 MB
+        _sparse_file(f1, 1024 * 1024)  # 1 MB
 
         info = km.get_cache_info()
         assert info["file_count"] == 1
@@ -92,6 +149,22 @@ class TestKernelManager:
         km.ensure_generic_kernels()  # should be no-op
         assert mock_download.call_count == first_count
 
+    @patch("heliospice.kernel_manager.spice")
+    @patch("heliospice.kernel_manager.KernelManager.download_kernel")
+    def test_ensure_lsk_only_downloads_lsk(self, mock_download, mock_spice, tmp_path):
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        mock_download.return_value = tmp_path / "naif0012.tls"
+        (tmp_path / "naif0012.tls").write_text("fake")
+
+        km.ensure_lsk()
+        km.ensure_lsk()  # second call should be no-op
+
+        assert mock_download.call_count == 1
+        assert mock_download.call_args.args[1] == "naif0012.tls"
+        assert km._generic_loaded is False
+
     @patch("heliospice.kernel_manager.spice")
     @patch("heliospice.kernel_manager.KernelManager.download_kernel")
     def test_ensure_mission_kernels(self, mock_download, mock_spice, tmp_path):
@@ -104,6 +177,106 @@ class TestKernelManager:
         km.ensure_mission_kernels("PSP")
         assert "PSP" in km._mission_kernels_loaded
 
+    @patch("heliospice.kernel_manager.spice")
+    @patch("requests.Session.get")
+    def test_download_kernel_streams_to_disk(self, mock_get, mock_spice, tmp_path):
+        import io
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        payload = b"DAF/SPK " * 100_000
+        mock_get.return_value.raw = io.BytesIO(payload)
+        mock_get.return_value.headers = {"Content-Length": str(len(payload))}
+
+        path = km.download_kernel("https://example.com/k.bsp", "k.bsp")
+
+        assert path.read_bytes() == payload
+        assert not (tmp_path / "k.tmp").exists()
+
+    @patch("heliospice.kernel_manager.spice")
+    @patch("requests.Session.get")
+    def test_download_kernel_trims_overstated_length(self, mock_get, mock_spice, tmp_path):
+        """Preallocated space beyond the received body is truncated away."""
+        import io
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        payload = b"x" * 1000
+        mock_get.return_value.raw = io.BytesIO(payload)
+        mock_get.return_value.headers = {"Content-Length": "4096"}
+
+        path = km.download_kernel("https://example.com/k.bsp", "k.bsp")
+
+        assert path.read_bytes() == payload
+
+    @patch("heliospice.kernel_manager.spice")
+    @patch("requests.Session.head")
+    @patch("heliospice.kernel_manager.KernelManager._fetch_kernel")
+    def test_validate_cache_redownloads_truncated(
+        self, mock_fetch, mock_head, mock_spice, tmp_path, monkeypatch
+    ):
+        """HELIOSPICE_VALIDATE_CACHE=1 re-fetches files whose size mismatches."""
+        from heliospice.kernel_manager import KernelManager
+        monkeypatch.setenv("HELIOSPICE_VALIDATE_CACHE", "1")
+        km = KernelManager(kernel_dir=tmp_path)
+
+        (tmp_path / "good.bsp").write_bytes(b"x" * 100)
+        (tmp_path / "short.bsp").write_bytes(b"x" * 40)
+        mock_head.return_value.headers = {"Content-Length": "100"}
+        mock_fetch.side_effect = lambda url, filename, local_path: local_path
+
+        km.download_kernel("https://example.com/good.bsp", "good.bsp")
+        assert mock_fetch.call_count == 0
+
+        km.download_kernel("https://example.com/short.bsp", "short.bsp")
+        assert mock_fetch.call_count == 1
+
+    @patch("heliospice.kernel_manager.spice")
+    @patch("heliospice.kernel_manager.KernelManager._fetch_kernel")
+    def test_download_kernels_parallel_preserves_order(self, mock_fetch, mock_spice, tmp_path):
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        def fake_fetch(url, filename, local_path):
+            local_path.write_text("fake")
+            return local_path
+
+        mock_fetch.side_effect = fake_fetch
+
+        jobs = [(f"https://example.com/k{i}.bsp", f"k{i}.bsp") for i in range(6)]
+        jobs.append(jobs[0])  # duplicate request for the same file
+        paths = km.download_kernels(jobs)
+
+        assert [p.name for p in paths] == [filename for _, filename in jobs]
+        assert mock_fetch.call_count == 6  # duplicate served from cache
+
+    @patch("heliospice.kernel_manager.spice")
+    @patch("heliospice.kernel_manager.KernelManager._fetch_kernel")
+    def test_download_kernels_while_holding_lock(self, mock_fetch, mock_spice, tmp_path):
+        """Workers can create the HTTP session while the caller holds km.lock."""
+        import threading
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        def fake_fetch(url, filename, local_path):
+            km._get_session()
+            local_path.write_text("fake")
+            return local_path
+
+        mock_fetch.side_effect = fake_fetch
+        jobs = [(f"https://example.com/k{i}.bsp", f"k{i}.bsp") for i in range(2)]
+        result = []
+
+        def run():
+            with km.lock:
+                result.extend(km.download_kernels(jobs))
+
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        t.join(timeout=10)
+        assert not t.is_alive(), "download_kernels deadlocked on km.lock"
+        assert [p.name for p in result] == ["k0.bsp", "k1.bsp"]
+
     @patch("heliospice.kernel_manager.spice")
     @patch("heliospice.kernel_manager.KernelManager.download_kernel")
     def test_ensure_mission_kernels_unknown(self, mock_download, mock_spice, tmp_path):
@@ -142,8 +315,8 @@ class TestKernelManager:
 
         f1 = tmp_path / "a.bsp"
         f2 = tmp_path / "b.bsp"
-        f1.write_bytes(b"x" * (1024 * 1024))
-        f2.write_bytes(b"y" * (1024 * 1024))
+        _sparse_file(f1, 1024 * 1024)
+        _sparse_file(f2, 1024 * 1024)
         km.load_kernel(f1)
 
         result = km.delete_cached_files(["a.bsp", "b.bsp"])
@@ -172,7 +345,7 @@ class TestKernelManager:
         km = KernelManager(kernel_dir=tmp_path)
 
         for name in ["a.bsp", "b.bsp", "c.tls"]:
-            (tmp_path / name).write_bytes(b"x" * (1024 * 1024))
+            _sparse_file(tmp_path / name, 1024 * 1024)
             km.load_kernel(tmp_path / name)
 
         result = km.purge_cache()
@@ -181,6 +354,50 @@ class TestKernelManager:
         assert km.list_loaded() == []
         assert list(tmp_path.iterdir()) == []
 
+    @patch("heliospice.kernel_manager.spice")
+    def test_evict_cache_lru_k(self, mock_spice, tmp_path):
+        """evict_cache drops cold and one-off files before a large kernel in routine use."""
+        import time
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+        mb = 1024 * 1024
+
+        _sparse_file(tmp_path / "hot.bsp", 4 * mb)
+        for name in ["seg_a.bsp", "seg_b.bsp", "seg_c.bsp"]:
+            _sparse_file(tmp_path / name, mb)
+        _sparse_file(tmp_path / "old.bsp", mb)
+        week_ago = time.time() - 7 * 86400
+        os.utime(tmp_path / "old.bsp", (week_ago, week_ago))
+
+        km.load_kernel(tmp_path / "hot.bsp")
+        for _ in range(3):
+            km.load_kernel(tmp_path / "hot.bsp")  # already loaded: still a use
+        for name in ["seg_a.bsp", "seg_b.bsp", "seg_c.bsp"]:
+            km.load_kernel(tmp_path / name)  # one-off sweep
+        assert mock_spice.furnsh.call_count == 4
+
+        assert km.evict_cache(8 * mb) == {"deleted": [], "freed_mb": 0.0}
+        assert km.evict_cache(7 * mb)["deleted"] == ["old.bsp"]
+        assert sorted(km.evict_cache(4 * mb)["deleted"]) == ["seg_a.bsp", "seg_b.bsp", "seg_c.bsp"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["hot.bsp"]
+
+    @patch("heliospice.kernel_manager.spice")
+    @patch("heliospice.kernel_manager.KernelManager.download_kernel")
+    def test_ensure_mission_kernels_records_use_when_loaded(self, mock_download, mock_spice, tmp_path):
+        """Repeat ensure_mission_kernels calls count as uses of the mission's kernels."""
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+        km._generic_loaded = True
+        mock_download.side_effect = lambda url, filename: tmp_path / filename
+
+        kernels = {"test.bsp": "https://example.com/test.bsp"}
+        with patch.dict("heliospice.kernel_manager.MISSION_KERNELS", {"TEST": kernels}):
+            km.ensure_mission_kernels("TEST")
+            km.ensure_mission_kernels("TEST")
+
+        assert mock_spice.furnsh.call_count == 1
+        assert len(km._use_history["test.bsp"]) == 2
+
     @patch("heliospice.kernel_manager.spice")
     def test_cache_info_groups_by_mission(self, mock_spice, tmp_path):
         """get_cache_info groups files by mission."""
@@ -213,7 +430,7 @@ class TestCheckRemoteKernels:
 </pre></body></html>"""
 
     @patch("heliospice.kernel_manager.spice")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_parses_directory_and_finds_other_files(self, mock_get, mock_spice, tmp_path):
         """Parses NAIF HTML listing and identifies other_files correctly."""
         from heliospice.kernel_manager import KernelManager
@@ -221,7 +438,7 @@ class TestCheckRemoteKernels:
 
         mock_resp = mock_get.return_value
         mock_resp.raise_for_status.return_value = None
-        mock_resp.text = self.NAIF_HTML
+        mock_resp.content = self.NAIF_HTML.encode()
 
         result = km.check_remote_kernels("JUNO")
 
@@ -241,7 +458,7 @@ class TestCheckRemoteKernels:
         assert "juno_rec_orbit.bsp" not in result["other_files"]
 
     @patch("heliospice.kernel_manager.spice")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_filters_only_bsp_files(self, mock_get, mock_spice, tmp_path):
         """Only .bsp files are included, not .txt or other extensions."""
         from heliospice.kernel_manager import KernelManager
@@ -257,7 +474,7 @@ class TestCheckRemoteKernels:
 
         mock_resp = mock_get.return_value
         mock_resp.raise_for_status.return_value = None
-        mock_resp.text = html
+        mock_resp.content = html.encode()
 
         result = km.check_remote_kernels("JUNO")
 
@@ -269,7 +486,7 @@ class TestCheckRemoteKernels:
         assert "notes.tls" not in all_bsp
 
     @patch("heliospice.kernel_manager.spice")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_handles_http_error_gracefully(self, mock_get, mock_spice, tmp_path):
         """HTTP errors are captured in the result, not raised as exceptions."""
         from heliospice.kernel_manager import KernelManager
@@ -285,6 +502,57 @@ class TestCheckRemoteKernels:
         assert "404" in result["directories"][0]["error"]
         assert result["directories"][0]["all_bsp_files"] == []
 
+    @patch("heliospice.kernel_manager.spice")
+    @patch("requests.Session.get")
+    def test_multiple_directories_keep_order(self, mock_get, mock_spice, tmp_path):
+        """Directories fetched concurrently are reported in configured order."""
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        kernels = {
+            "a.bsp": "https://example.com/spk/a.bsp",
+            "b.bsp": "https://example.com/spk_extra/b.bsp",
+        }
+
+        def fake_get(url, timeout, headers):
+            resp = MagicMock()
+            name = "new_spk.bsp" if url.endswith("/spk/") else "new_extra.bsp"
+            resp.content = f'<a href="{name}">{name}</a>'.encode()
+            return resp
+
+        mock_get.side_effect = fake_get
+        with patch.dict("heliospice.kernel_manager.MISSION_KERNELS", {"TEST": kernels}):
+            result = km.check_remote_kernels("TEST")
+
+        assert [d["url"] for d in result["directories"]] == [
+            "https://example.com/spk/", "https://example.com/spk_extra/",
+        ]
+        assert result["other_files"] == ["new_extra.bsp", "new_spk.bsp"]
+
+    @patch("heliospice.kernel_manager.spice")
+    @patch("requests.Session.get")
+    def test_unchanged_listing_revalidated(self, mock_get, mock_spice, tmp_path):
+        """A repeat check sends the stored validators and reuses the listing on 304."""
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        first = MagicMock(status_code=200, content=self.NAIF_HTML.encode())
+        first.headers = {"ETag": '"abc"', "Last-Modified": "Fri, 15 Mar 2024 12:00:00 GMT"}
+        not_modified = MagicMock(status_code=304, content=b"", headers={})
+        mock_get.side_effect = [first, not_modified]
+
+        before = km.check_remote_kernels("JUNO")
+        after = km.check_remote_kernels("JUNO")
+
+        assert mock_get.call_args_list[0].kwargs["headers"] == {}
+        assert mock_get.call_args_list[1].kwargs["headers"] == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Fri, 15 Mar 2024 12:00:00 GMT",
+        }
+        not_modified.raise_for_status.assert_not_called()
+        assert after["directories"] == before["directories"]
+        assert after["other_files"] == ["juno_pred_orbit.bsp", "juno_rec_orbit_v2.bsp"]
+
     @patch("heliospice.kernel_manager.spice")
     def test_raises_keyerror_for_segmented_mission(self, mock_spice, tmp_path):
         """Raises KeyError when called with a segmented mission."""
@@ -40,11 +40,51 @@ class TestMissions:
         assert naif_id == 399
         assert key == "EARTH"
 
+    def test_resolve_mission_compact(self):
+        from heliospice.missions import resolve_mission
+        naif_id, key = resolve_mission("stereoa")
+        assert naif_id == -234
+        assert key == "STEREO_A"
+
+    def test_resolve_mission_ignores_punctuation(self):
+        from heliospice.missions import resolve_mission
+        assert resolve_mission("STEREO/A") == (-234, "STEREO_A")
+        assert resolve_mission("Voyager.1") == (-31, "VOYAGER_1")
+        assert resolve_mission(" van-allen probe a ") == (-362, "RBSP_A")
+
+    def test_resolve_mission_short_alias(self):
+        from heliospice.missions import resolve_mission
+        assert resolve_mission("bepi") == (-121, "BEPICOLOMBO")
+        assert resolve_mission("NH") == (-98, "NEW_HORIZONS")
+
+    def test_resolve_mission_no_prefix_match(self):
+        """Partial names fall through so SPICE can resolve natural bodies."""
+        from heliospice.missions import resolve_mission
+        for name in ("Europa", "LUNA", "SOL", "HELIOS", "new"):
+            with pytest.raises(KeyError):
+                resolve_mission(name)
+
     def test_resolve_mission_unknown(self):
         from heliospice.missions import resolve_mission
         with pytest.raises(KeyError, match="Unknown mission"):
             resolve_mission("NONEXISTENT_SPACECRAFT")
 
+    def test_resolve_mission_cached(self):
+        from heliospice.missions import resolve_mission
+        resolve_mission.cache_clear()
+        first = resolve_mission("Parker Solar Probe")
+        second = resolve_mission("Parker Solar Probe")
+        assert first == second == (-96, "PSP")
+        assert resolve_mission.cache_info().hits == 1
+
+    def test_resolve_mission_unknown_not_cached(self):
+        from heliospice.missions import resolve_mission
+        resolve_mission.cache_clear()
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                resolve_mission("NONEXISTENT_SPACECRAFT")
+        assert resolve_mission.cache_info().currsize == 0
+
     def test_list_supported_missions(self):
         from heliospice.missions import list_supported_missions
         missions = list_supported_missions()
@@ -54,6 +94,7 @@ class TestMissions:
             assert m["naif_id"] < 0
             assert "mission_key" in m
             assert "has_kernels" in m
+            assert "segmented" in m
 
     def test_list_includes_psp(self):
         from heliospice.missions import list_supported_missions
@@ -63,3 +104,11 @@ class TestMissions:
         # PSP should have kernels defined
         psp = [m for m in missions if m["mission_key"] == "PSP"][0]
         assert psp["has_kernels"] is True
+        assert psp["segmented"] is False
+
+    def test_list_supported_missions_returns_copies(self):
+        from heliospice.missions import list_supported_missions
+        first = list_supported_missions()
+        first[0]["kernels_loaded"] = True
+        second = list_supported_missions()
+        assert "kernels_loaded" not in second[0]
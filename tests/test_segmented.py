@@ -43,11 +43,9 @@ class TestSegmentedMissions:
 
     def test_list_supported_missions_includes_segmented(self):
         from heliospice.missions import list_supported_missions
-        missions = list_supported_missions()
-        cassini = next(m for m in missions if m["mission_key"] == "CASSINI")
-        assert cassini["has_kernels"] is True
-        mro = next(m for m in missions if m["mission_key"] == "MRO")
-        assert mro["has_kernels"] is True
+        by_key = {m["mission_key"]: m for m in list_supported_missions()}
+        assert by_key["CASSINI"]["has_kernels"] is True
+        assert by_key["MRO"]["has_kernels"] is True
 
 
 # ---- kernel_manager.py tests ----
@@ -145,6 +143,49 @@ class TestKernelManagerSegmented:
         km.ensure_segmented_kernels("CASSINI", date(2005, 2, 1), date(2005, 2, 1))
         assert mock_download.call_count == first_download_count
 
+    @patch("heliospice.kernel_manager.spice")
+    @patch("heliospice.kernel_manager.KernelManager._load_manifest")
+    def test_segment_index_sorted_and_cached(self, mock_manifest, mock_spice, tmp_path):
+        """Segment index is sorted by start, date-typed, and built once per mission."""
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        mock_manifest.return_value = list(reversed(SAMPLE_MANIFEST))
+
+        segments, starts, stops, _ = km._get_segment_index("CASSINI")
+        km._get_segment_index("CASSINI")
+
+        assert [s["file"] for s in segments] == ["seg_a.bsp", "seg_b.bsp", "seg_c.bsp"]
+        assert starts[0] == date(2004, 5, 14)
+        assert stops[-1] == date(2005, 3, 1)
+        assert mock_manifest.call_count == 1
+
+    @patch("heliospice.kernel_manager.spice")
+    @patch("heliospice.kernel_manager.KernelManager.download_kernel")
+    @patch("heliospice.kernel_manager.KernelManager._load_manifest")
+    def test_ensure_segmented_kernels_overlapping_segments(
+        self, mock_manifest, mock_download, mock_spice, tmp_path
+    ):
+        """A long early segment still matches queries past later, shorter ones."""
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+
+        mock_manifest.return_value = [
+            {"file": "long.bsp", "url": "https://example.com/long.bsp",
+             "start": "2004-01-01", "stop": "2006-01-01"},
+            {"file": "short.bsp", "url": "https://example.com/short.bsp",
+             "start": "2004-02-01", "stop": "2004-03-01"},
+            {"file": "late.bsp", "url": "https://example.com/late.bsp",
+             "start": "2005-06-01", "stop": "2005-07-01"},
+        ]
+        fake_path = tmp_path / "fake.bsp"
+        fake_path.write_text("fake")
+        mock_download.return_value = fake_path
+
+        km.ensure_segmented_kernels("CASSINI", date(2005, 1, 1), date(2005, 2, 1))
+
+        assert km._segmented_files_loaded == {"long.bsp"}
+
     @patch("heliospice.kernel_manager.spice")
     @patch("heliospice.kernel_manager.KernelManager._load_manifest")
     def test_ensure_segmented_kernels_no_coverage(
@@ -171,6 +212,50 @@ class TestKernelManagerSegmented:
         with pytest.raises(ValueError, match="empty"):
             km.ensure_segmented_kernels("CASSINI", date(2005, 1, 1), date(2005, 2, 1))
 
+    @patch("heliospice.kernel_manager.spice")
+    def test_load_manifest_parsed_once(self, mock_spice, tmp_path):
+        """Bundled manifests are parsed once and reused across calls."""
+        from heliospice.kernel_manager import KernelManager, _read_manifest
+        km = KernelManager(kernel_dir=tmp_path)
+
+        _read_manifest.cache_clear()
+        first = km._load_manifest("MARS_2020")
+        second = km._load_manifest("MARS_2020")
+
+        assert first is second
+        assert len(first) > 0
+        assert _read_manifest.cache_info().misses == 1
+
+    @patch("heliospice.kernel_manager.spice")
+    def test_file_to_mission_map_parses_manifests_once(self, mock_spice, tmp_path):
+        """Repeated cache lookups reuse the parsed manifest filename lists."""
+        from heliospice.kernel_manager import KernelManager, _manifest_files
+        from heliospice.missions import SEGMENTED_MISSIONS
+        km = KernelManager(kernel_dir=tmp_path)
+
+        _manifest_files.cache_clear()
+        km.get_cache_info()
+        km.delete_mission_cache("CASSINI")
+
+        assert _manifest_files.cache_info().misses == len(SEGMENTED_MISSIONS)
+        assert km._build_file_to_mission_map()["naif0012.tls"] == "GENERIC"
+
+    @patch("heliospice.kernel_manager.spice")
+    def test_file_to_mission_map_sees_registered_kernels(self, mock_spice, tmp_path):
+        """Kernels registered after the first lookup are classified and deletable."""
+        from heliospice.kernel_manager import KernelManager
+        km = KernelManager(kernel_dir=tmp_path)
+        km.get_cache_info()
+
+        (tmp_path / "extra.bsp").write_text("fake")
+        kernels = {"extra.bsp": "https://example.com/extra.bsp"}
+        with patch.dict("heliospice.kernel_manager.MISSION_KERNELS", {"EXTRA": kernels}):
+            km._mission_kernels_loaded.add("EXTRA")
+            assert "EXTRA" in km.get_cache_info()["missions"]
+            assert km.delete_mission_cache("EXTRA")["deleted"] == ["extra.bsp"]
+
+        assert "EXTRA" not in km._mission_kernels_loaded
+
     @patch("heliospice.kernel_manager.spice")
     @patch("heliospice.kernel_manager.KernelManager.download_kernel")
     def test_ensure_mission_kernels_segmented_error(
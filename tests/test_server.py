@@ -77,8 +77,9 @@ class TestMCPTools:
 
     @patch("heliospice.ephemeris.get_kernel_manager")
     @patch("heliospice.ephemeris.spice")
-    def test_timeseries_rejects_large_response(self, mock_spice, mock_get_km):
+    def test_timeseries_rejects_large_response(self, mock_spice, mock_get_km, fake_gdpool):
         """Timeseries with >10k points is rejected when allow_large_response=False."""
+        import numpy as np
         from heliospice.server import _MAX_RESPONSE_POINTS
 
         mock_km = MagicMock()
@@ -89,11 +90,10 @@ class TestMCPTools:
 
         n_points = _MAX_RESPONSE_POINTS + 100
         mock_spice.utc2et.side_effect = lambda t: 0.0 if "01-01" in t else float(n_points)
-        mock_spice.spkpos.return_value = ([1.496e8, 0.0, 0.0], 499.0)
-        mock_spice.et2utc.side_effect = [
-            f"2024-01-01T{i // 3600:02d}:{(i % 3600) // 60:02d}:{i % 60:02d}.000"
-            for i in range(n_points + 1)
-        ]
+        mock_spice.spkpos.side_effect = lambda targ, et, *a: (
+            np.tile([1.496e8, 0.0, 0.0], (len(et), 1)), np.full(len(et), 499.0)
+        )
+        mock_spice.gdpool.side_effect = fake_gdpool
 
         # Call the trajectory function and apply the same guard logic
         from heliospice.ephemeris import get_trajectory
@@ -106,7 +106,7 @@ class TestMCPTools:
 
     @patch("heliospice.ephemeris.get_kernel_manager")
     @patch("heliospice.ephemeris.spice")
-    def test_timeseries_with_velocity(self, mock_spice, mock_get_km):
+    def test_timeseries_with_velocity(self, mock_spice, mock_get_km, fake_gdpool):
         """Timeseries with include_velocity includes speed computation."""
         import numpy as np
         from heliospice.ephemeris import get_trajectory
@@ -119,9 +119,9 @@ class TestMCPTools:
 
         mock_spice.utc2et.return_value = 0.0
         mock_spice.spkezr.return_value = (
-            [1.496e8, 0.0, 0.0, 0.0, 29.78, 0.0], 499.0
+            np.array([[1.496e8, 0.0, 0.0, 0.0, 29.78, 0.0]]), np.array([499.0])
         )
-        mock_spice.et2utc.return_value = "2024-01-01T00:00:00.000"
+        mock_spice.gdpool.side_effect = fake_gdpool
 
         df = get_trajectory(
             "EARTH", "SUN", "2024-01-01", "2024-01-01",
@@ -134,6 +134,30 @@ class TestMCPTools:
         )
         assert speed.iloc[0] == pytest.approx(29.78, rel=1e-6)
 
+    @patch("heliospice.kernel_manager.get_kernel_manager")
+    @patch("heliospice.ephemeris.get_trajectory")
+    def test_timeseries_rejects_large_response_before_spice(self, mock_traj, mock_get_km):
+        """Oversized timeseries is rejected from the inputs alone."""
+        mock_get_km.return_value.get_cache_size_bytes.return_value = 3 * 1024 * 1024
+        tool = self._get_tool_func("get_spacecraft_ephemeris")
+        result = tool.fn(
+            "PSP", "2024-01-01", "ECLIPJ2000", "SUN",
+            time_end="2024-04-30", step="1s",
+        )
+        mock_traj.assert_not_called()
+        n_points = result.pop("n_points")
+        assert n_points == 100_001  # 10.4M requested, capped by get_trajectory
+        assert result.pop("message").startswith(f"Response contains {n_points:,} data points")
+        assert result == {
+            "status": "error",
+            "cache_size_mb": 3.0,
+            "spacecraft": "PSP",
+            "observer": "SUN",
+            "frame": "ECLIPJ2000",
+            "time_start": "2024-01-01",
+            "time_end": "2024-04-30",
+        }
+
     def test_server_has_six_tools(self):
         """Server registers exactly 6 tools after merge."""
         from heliospice.server import _create_server
@@ -144,3 +168,47 @@ class TestMCPTools:
         assert "get_spacecraft_position" not in tools
         assert "get_spacecraft_trajectory" not in tools
         assert "get_spacecraft_velocity" not in tools
+
+
+class TestResponseHelpers:
+    """Test the DataFrame-to-JSON helpers used by the timeseries tools."""
+
+    def test_frame_records(self):
+        import pandas as pd
+        from heliospice.server import _frame_records
+
+        df = pd.DataFrame(
+            {"r_au": [1.0, 1.5], "r_km": [1.496e8, 2.244e8]},
+            index=pd.DatetimeIndex(["2024-01-01", "2024-01-01 01:00"]),
+        )
+        records = _frame_records(df)
+        assert records == [
+            {"time": "2024-01-01 00:00:00", "r_au": 1.0, "r_km": 1.496e8},
+            {"time": "2024-01-01 01:00:00", "r_au": 1.5, "r_km": 2.244e8},
+        ]
+        assert type(records[0]["r_au"]) is float
+
+    def test_frame_columns(self):
+        import pandas as pd
+        from heliospice.server import _frame_columns
+
+        df = pd.DataFrame(
+            {"r_au": [1.0, 1.5], "r_km": [1.496e8, 2.244e8]},
+            index=pd.DatetimeIndex(["2024-01-01", "2024-01-01 01:00"]),
+        )
+        assert _frame_columns(df) == {
+            "time": ["2024-01-01 00:00:00", "2024-01-01 01:00:00"],
+            "r_au": [1.0, 1.5],
+            "r_km": [1.496e8, 2.244e8],
+        }
+
+    def test_estimate_points(self):
+        from heliospice.server import _estimate_points
+
+        assert _estimate_points("2024-01-01", "2024-01-31", "1h") == 721
+        assert _estimate_points("2024-01-01", "2024-01-01", "1h") == 1
+        assert _estimate_points("2024-01-01", "2024-04-30", "1s") == 100_001  # trajectory cap
+        # Unparseable here: left to get_trajectory
+        assert _estimate_points("Jan 1 2024", "2024-01-02", "1h") is None
+        with pytest.raises(ValueError, match="Invalid step"):
+            _estimate_points("2024-01-01", "2024-01-02", "1w")